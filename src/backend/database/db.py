@@ -1,3 +1,5 @@
+import asyncio
+
 from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession
 from src.config import get_settings
 
@@ -7,7 +9,27 @@ settings = get_settings()
 engine = create_async_engine(
     settings.db.connection_string.get_secret_value(),
     echo=settings.env == "development",
-    future=True
+    future=True,
+    pool_size=settings.db.pool_size,
+    max_overflow=settings.db.pool_max_overflow,
+    # Long-lived connections get silently cut by proxies / idle timeouts — rotate them.
+    pool_recycle=settings.db.pool_recycle_sec,
+    connect_args={
+        # A hung statement fails instead of holding a pooled connection forever.
+        "command_timeout": settings.db.command_timeout_sec,
+        # asyncpg server-side prepared statements: parse/plan once per connection.
+        "statement_cache_size": 1024,
+        "max_cacheable_statement_size": 16 * 1024,
+        # SQLAlchemy's own cache of asyncpg PreparedStatement objects (default 100).
+        "prepared_statement_cache_size": 1024,
+        # Per-connection session settings, applied at connect:
+        #   jit=off — JIT compilation costs more than it saves on sub-ms OLTP/COPY statements.
+        # TCP_NODELAY and the binary wire format are asyncpg defaults — nothing to set.
+        "server_settings": {
+            "jit": "off",
+            "application_name": "forza_backend",
+        },
+    },
 )
 
 # Main Database Session Factory
@@ -25,6 +47,16 @@ async def get_db():
         finally:
             await session.close()
 
+async def warm_pool():
+    """
+    Opens pool_size connections up front and returns them to the pool.
+
+    Connections are otherwise established lazily on first checkout, which puts the
+    TCP + auth handshake on the first requests after startup.
+    """
+    conns = await asyncio.gather(*(engine.connect() for _ in range(settings.db.pool_size)))
+    await asyncio.gather(*(conn.close() for conn in conns))
+
 async def init_db():
     """Initialize relational database tables."""
     from src.backend.database.relational import MainBase
@@ -41,8 +73,33 @@ async def init_telemetry_db():
         await conn.run_sync(TSBase.metadata.create_all)
         
         # 2. Convert telemetry to hypertable (only if not already converted)
-        # TimescaleDB requires the 'time' column for hypertable
+        # TimescaleDB requires the 'time' column for hypertable.
+        # 1-hour chunks: a session at 60 Hz is ~216k rows/h — small enough to compress
+        # whole chunks soon after a session ends, large enough to keep the chunk count low.
         await conn.execute(text("""
-            SELECT create_hypertable('telemetry', 'time', if_not_exists => TRUE);
+            SELECT create_hypertable(
+                'telemetry', 'time',
+                chunk_time_interval => INTERVAL '1 hour',
+                if_not_exists => TRUE
+            );
         """))
 
+        # 3. Columnar compression: one segment per session, time-ordered inside it,
+        # so per-session range scans decompress only their own segments.
+        # Set once: TimescaleDB rejects changing these settings once compressed chunks exist.
+        compression_enabled = await conn.scalar(text("""
+            SELECT compression_enabled
+            FROM timescaledb_information.hypertables
+            WHERE hypertable_name = 'telemetry';
+        """))
+        if not compression_enabled:
+            await conn.execute(text("""
+                ALTER TABLE telemetry SET (
+                    timescaledb.compress,
+                    timescaledb.compress_segmentby = 'session_id',
+                    timescaledb.compress_orderby = 'time DESC'
+                );
+            """))
+        await conn.execute(text("""
+            SELECT add_compression_policy('telemetry', INTERVAL '7 days', if_not_exists => TRUE);
+        """))
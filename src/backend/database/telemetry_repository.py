@@ -0,0 +1,188 @@
+import asyncio
+import logging
+import time
+from collections import deque
+from typing import Iterable, Sequence
+
+from sqlalchemy import text
+from sqlalchemy.ext.asyncio import AsyncConnection
+
+from src.backend.database.db import engine
+from src.backend.database.models_telemetry import Telemetry
+
+logger = logging.getLogger(__name__)
+
+# Pause before the next drain pass after a batch was dropped (database unreachable).
+_RETRY_DELAY_SEC = 1.0
+# Minimum gap between two write-failure log lines.
+_FAILURE_LOG_INTERVAL_SEC = 30.0
+
+# Column order of every record passed to save_batch() — mirrors the Telemetry model.
+TELEMETRY_COLUMNS: tuple[str, ...] = tuple(c.name for c in Telemetry.__table__.columns)
+
+
+async def copy_telemetry(conn: AsyncConnection, records: Iterable[Sequence]) -> None:
+    """
+    Bulk-load telemetry rows with PostgreSQL COPY (binary protocol).
+
+    One COPY stream replaces a round-trip per row (INSERT / executemany), which is
+    what ingest bottlenecks on at 60 Hz per active session.
+
+    Args:
+        conn:    open SQLAlchemy async connection (asyncpg driver); the caller owns the transaction.
+        records: row tuples in TELEMETRY_COLUMNS order.
+    """
+    raw = await conn.get_raw_connection()
+    await raw.driver_connection.copy_records_to_table(
+        Telemetry.__tablename__,
+        records=records,
+        columns=TELEMETRY_COLUMNS,
+    )
+
+
+async def _write(conn: AsyncConnection, records: Sequence[Sequence]) -> None:
+    """One telemetry transaction on an already open connection (see save_batch)."""
+    async with conn.begin():
+        await conn.execute(text("SET LOCAL synchronous_commit = off"))
+        await copy_telemetry(conn, records)
+
+
+async def save_batch(records: Sequence[Sequence]) -> int:
+    """
+    Writes one batch of telemetry rows in a single transaction.
+
+    The transaction runs with synchronous_commit = off: the commit does not wait for
+    the WAL fsync. A crash may lose the last fraction of a second of telemetry, which
+    is acceptable for time-series samples — and only this transaction is affected
+    (SET LOCAL), relational data keeps full durability.
+
+    Returns the number of rows written.
+    """
+    if not records:
+        return 0
+    async with engine.connect() as conn:
+        await _write(conn, records)
+    return len(records)
+
+
+class TelemetryWriter:
+    """
+    Single writer task for telemetry: callers hand batches over a deque channel,
+    one background task COPYs them in arrival order.
+
+    Replaces a task + pool checkout per batch with one long-lived consumer — ordering
+    is FIFO by construction and at most one COPY is in flight. Batches that queue up
+    while a COPY runs are coalesced into the next one (up to max_coalesce_rows rows),
+    so a backlog costs fewer, larger COPY calls instead of many small ones.
+
+    A pooled connection is checked out per drain pass and returned once the queue is
+    empty — the writer does not pin a pool slot while idle, and pool_recycle applies.
+    A failed batch is retried once on a fresh connection, then dropped.
+
+    The channel is bounded (max_pending_batches, Drop Oldest): while the database is
+    unreachable memory stays capped; evicted batches are counted in dropped_total.
+
+    Usage:
+        writer = TelemetryWriter()
+        writer.start()
+        writer.submit(records)   # non-blocking, from the same event loop
+        await writer.close()     # drains queued batches, then stops
+    """
+
+    def __init__(self, max_coalesce_rows: int = 10_000, max_pending_batches: int = 1_000) -> None:
+        self._max_coalesce_rows = max_coalesce_rows
+        self._queue: deque[Sequence[Sequence]] = deque(maxlen=max_pending_batches)
+        self._wake = asyncio.Event()
+        self._closing = False
+        self._task: asyncio.Task | None = None
+        self.dropped_total = 0
+
+        # Failure log throttle: a database outage must not print a traceback per batch.
+        self._last_failure_log = float("-inf")
+        self._failures_suppressed = 0
+
+    def start(self) -> None:
+        self._closing = False
+        self._task = asyncio.create_task(self._run())
+
+    def submit(self, records: Sequence[Sequence]) -> None:
+        if records:
+            queue = self._queue
+            if len(queue) == queue.maxlen:
+                # append() below evicts the oldest batch
+                self.dropped_total += 1
+            queue.append(records)
+            self._wake.set()
+
+    async def close(self) -> None:
+        self._closing = True
+        self._wake.set()
+        if self._task is not None:
+            await self._task
+            self._task = None
+
+    async def _run(self) -> None:
+        while True:
+            if not self._queue:
+                if self._closing:
+                    return
+                await self._wake.wait()
+                self._wake.clear()
+                continue
+            if not await self._drain():
+                if self._closing:
+                    logger.error("TelemetryWriter: dropping %d batches on shutdown", len(self._queue))
+                    self.dropped_total += len(self._queue)
+                    self._queue.clear()
+                    return
+                await asyncio.sleep(_RETRY_DELAY_SEC)
+
+    async def _drain(self) -> bool:
+        """
+        One pass: writes everything queued over one pooled connection, then returns it.
+
+        A batch that fails is retried once on a fresh connection (the first one may have
+        been cut by the server); if that fails too, the batch is dropped and False returned.
+        """
+        records = self._next_records()
+        try:
+            async with engine.connect() as conn:
+                await _write(conn, records)
+                while self._queue:
+                    records = self._next_records()
+                    await _write(conn, records)
+            return True
+        except Exception:
+            pass
+        try:
+            async with engine.connect() as conn:
+                await _write(conn, records)
+            return True
+        except Exception as exc:
+            self.dropped_total += 1
+            self._log_failure(exc, len(records))
+            return False
+
+    def _log_failure(self, exc: Exception, rows: int) -> None:
+        """At most one line (with traceback) per _FAILURE_LOG_INTERVAL_SEC; the next one reports the suppressed count."""
+        now = time.monotonic()
+        if now - self._last_failure_log < _FAILURE_LOG_INTERVAL_SEC:
+            self._failures_suppressed += 1
+            return
+        self._last_failure_log = now
+        suppressed, self._failures_suppressed = self._failures_suppressed, 0
+        logger.error(
+            "TelemetryWriter: write failed after retry, dropped %d rows (suppressed=%d)",
+            rows, suppressed, exc_info=exc,
+        )
+
+    def _next_records(self) -> Sequence[Sequence]:
+        """Pops the oldest batch, merged with the following ones while under the row cap."""
+        queue = self._queue
+        records = queue.popleft()
+        if not queue or len(records) >= self._max_coalesce_rows:
+            return records
+        merged = list(records)
+        while queue and len(merged) + len(queue[0]) <= self._max_coalesce_rows:
+            merged.extend(queue.popleft())
+        return merged
@@ -1,25 +1,37 @@
+from contextlib import asynccontextmanager
+
 import uvicorn
 from fastapi import FastAPI, Depends, HTTPException
+from fastapi.responses import ORJSONResponse
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy import select
 
-from src.backend.database.db import get_db, engine
+from src.backend.database.db import get_db, engine, init_telemetry_db, warm_pool
 from src.backend.database.models import MainBase, Car, Tune
 
-app = FastAPI(
-    title="Forza AI Tuner Backend",
-    description="API for Forza Horizon 5 AI Tuning and Telemetry",
-    version="0.1.0"
-)
-
-@app.on_event("startup")
-async def startup():
+@asynccontextmanager
+async def lifespan(app: FastAPI):
     # In development, we might want to create tables automatically 
     # if not using Alembic yet.
     async with engine.begin() as conn:
         # Note: This creates tables for the MainBase. 
         # For TSBase (Telemetry), manual creation or Alembic is better.
         await conn.run_sync(MainBase.metadata.create_all)
+    # Idempotent: hypertable, compression settings and policy are only created when missing.
+    await init_telemetry_db()
+    await warm_pool()
+    yield
+    # Same loop and process as the handlers: close pooled connections cleanly on shutdown.
+    await engine.dispose()
+
+app = FastAPI(
+    title="Forza AI Tuner Backend",
+    description="API for Forza Horizon 5 AI Tuning and Telemetry",
+    version="0.1.0",
+    lifespan=lifespan,
+    # orjson (already a dependency) instead of stdlib json for every response body.
+    default_response_class=ORJSONResponse,
+)
 
 @app.get("/health")
 async def health():
@@ -38,4 +50,13 @@ async def create_tune(tune_data: dict, db: AsyncSession = Depends(get_db)):
     return {"message": "Tune saving logic to be implemented", "received": tune_data}
 
 if __name__ == "__main__":
-    uvicorn.run("src.backend.main:app", host="0.0.0.0", port=8000, reload=True)
+    uvicorn.run(
+        "src.backend.main:app",
+        host="0.0.0.0",
+        port=8000,
+        reload=True,
+        http="httptools",  # C parser instead of pure-Python h11
+        ws="none",         # no WebSocket routes
+        access_log=False,  # one formatted log line per request otherwise
+        timeout_keep_alive=5,
+    )
@@ -1,7 +1,7 @@
 from enum import Enum
 from pathlib import Path
 from functools import lru_cache
-from pydantic import BaseModel, Field, SecretStr, PostgresDsn, field_validator
+from pydantic import BaseModel, ConfigDict, Field, SecretStr, PostgresDsn, field_validator
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 BASE_DIR = Path(__file__).resolve().parent.parent
@@ -18,14 +18,19 @@ class AppEnvironment(str, Enum):
 #  UDP network config
 class NetworkConfig(BaseModel):
     """UDP network config"""
+    model_config = ConfigDict(frozen=True)
+
     host: str = Field(default="127.0.0.1", description="IP address to bind")
     port: int = Field(default=5300, description="Forza UDP Port")
     api_url: str = Field(default="http://localhost:8000/api", description="Backend API URL for telemetry")
+    realtime: bool = Field(default=False, description="Run the UDP receive loop thread at realtime priority (Linux)")
 
 
 #  Database config
 class DatabaseConfig(BaseModel):
     """Database config"""
+    model_config = ConfigDict(frozen=True)
+
     host: str = Field(..., description="Database host")
     port: int = Field(..., description="Database port")
     user: str = Field(..., description="Database user")
@@ -33,9 +38,16 @@ class DatabaseConfig(BaseModel):
     password: SecretStr = Field(..., description="Database password")
     name: str = Field(..., description="Database name")
 
+    # Small pool: the backend has few concurrent writers, and idle connections cost server-side memory.
+    pool_size: int = Field(default=4, ge=1, description="Persistent connections kept in the pool")
+    pool_max_overflow: int = Field(default=2, ge=0, description="Extra connections allowed above pool_size")
+    pool_recycle_sec: int = Field(default=1800, ge=-1, description="Replace pooled connections older than this (-1 = never)")
+    command_timeout_sec: float = Field(default=30.0, gt=0, description="asyncpg per-statement timeout")
+
+    # Plain properties: a cached value would survive model_copy(update=...) with a stale host.
     @property
-    def connection_string(self) -> SecretStr:
-        """URL for connection SQLAlchemy/asyncpg"""
+    def asyncpg_dsn(self) -> SecretStr:
+        """URL for asyncpg connection (postgresql://)"""
         url = PostgresDsn.build(
             scheme="postgresql",
             username=self.user,
@@ -44,24 +56,24 @@ class DatabaseConfig(BaseModel):
             port=self.port,
             path=self.name
         )
-        return SecretStr(str(url).replace("postgresql://", "postgresql+asyncpg://"))
+        return SecretStr(str(url))
+
+    @property
+    def connection_string(self) -> SecretStr:
+        """URL for connection SQLAlchemy/asyncpg"""
+        dsn = self.asyncpg_dsn.get_secret_value()
+        return SecretStr(dsn.replace("postgresql://", "postgresql+asyncpg://", 1))
 
     def get_asyncpg_dsn(self) -> SecretStr:
         """URL for asyncpg connection (postgresql://)"""
-        url = PostgresDsn.build(
-            scheme="postgresql",
-            username=self.user,
-            password=self.password.get_secret_value(),
-            host=self.host,
-            port=self.port,
-            path=self.name
-        )
-        return SecretStr(str(url))
+        return self.asyncpg_dsn
 
 
 #  AI config
 class AIConfig(BaseModel):
     """AI config"""
+    model_config = ConfigDict(frozen=True)
+
     model_path: Path = Field(
         default=Path("src/desktop_client/models/v1_tuner.onnx"),
         description="Path to ONNX model file"
@@ -82,6 +94,8 @@ class AIConfig(BaseModel):
 #  UI config
 class UIConfig(BaseModel):
     """UI config"""
+    model_config = ConfigDict(frozen=True)
+
     # Relative path from project root
     main_window_path: Path = Field(
         default=Path("src/desktop_client/presentation/assets/api_v1.1.ui"),
@@ -117,7 +131,12 @@ class Settings(BaseSettings):
         env_file_encoding="utf-8",
         case_sensitive=False,
         env_nested_delimiter="_",
-        extra = "ignore"
+        # Split only at the first "_": DB_POOL_SIZE → db.pool_size, not db → pool → size.
+        env_nested_max_split=1,
+        extra = "ignore",
+        # Read-only after startup: get_settings() hands out one shared instance,
+        # and frozen models are hashable (safe as lru_cache keys downstream).
+        frozen=True,
     )
 
     env: AppEnvironment = Field(default=AppEnvironment.DEV, alias="APP_ENV")
@@ -112,20 +112,14 @@ class ConfigValidatorService(Generic[TModel]):
         """
         Преобразует pydantic.ValidationError в стандартизированный список ValidationError.
         """
-        errors: list[ValidationError] = []
-
-        for error in exc.errors(include_url=False):
-            loc_parts: tuple = error.get("loc", ())
-            readable_parts = [str(part) for part in loc_parts]
-            # Используем dot-notation по умолчанию для совместимости с UI
-            loc_key = ".".join(readable_parts) if readable_parts else None
-
-            msg: str = error.get("msg", "Invalid value")
-
-            errors.append(ValidationError(
-                code=ValidationErrorCode.SCHEMA_ERROR,
-                message=msg,
-                location=loc_key
-            ))
-
-        return tuple(errors)
+        # input/context не нужны UI и только плодят временные объекты на каждую ошибку.
+        schema_error = ValidationErrorCode.SCHEMA_ERROR
+        return tuple(
+            ValidationError(
+                code=schema_error,
+                message=error["msg"],
+                # Используем dot-notation по умолчанию для совместимости с UI
+                location=".".join(map(str, error["loc"])) or None,
+            )
+            for error in exc.errors(include_url=False, include_context=False, include_input=False)
+        )
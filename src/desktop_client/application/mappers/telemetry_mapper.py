@@ -1,9 +1,17 @@
 import dataclasses
 import structlog
+from operator import attrgetter
 from typing import Any, List
 
+from desktop_client.domain.models import TelemetryPacket
+
 logger = structlog.get_logger(__name__)
 
+# TelemetryPacket is flat (scalars only), so asdict()'s recursive deepcopy buys nothing:
+# one precompiled attrgetter call yields all values in field order.
+_FIELD_NAMES: tuple[str, ...] = tuple(f.name for f in dataclasses.fields(TelemetryPacket))
+_field_values = attrgetter(*_FIELD_NAMES)
+
 def serialize_batch(batch: List[Any], max_input_size: int = 1000) -> List[dict]:
     """
     Convert a batch of TelemetryPacket dataclasses to JSON-serialisable dicts.
@@ -27,4 +35,4 @@ def serialize_batch(batch: List[Any], max_input_size: int = 1000) -> List[dict]:
     # TODO: Implement an allowlist/blocklist for fields when serializing
     # to prevent accidental leakage of sensitive data (e.g., session tokens, player IDs)
     # if such fields are added to TelemetryPacket in the future.
-    return [dataclasses.asdict(packet) for packet in batch]
+    return [dict(zip(_FIELD_NAMES, _field_values(packet))) for packet in batch]
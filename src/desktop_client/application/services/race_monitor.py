@@ -1,8 +1,10 @@
-from typing import List, Optional
-import dataclasses
+from typing import Tuple
 from ...domain.models import TelemetryPacket
 from ...domain.events import RaceStarted, RaceStopped
 
+# Shared result for the common case (no transition) — no allocation per packet.
+_NO_EVENTS: Tuple = ()
+
 class RaceStateMonitor:
     """
     Monitors race state transitions (Started/Stopped).
@@ -11,27 +13,30 @@ class RaceStateMonitor:
     def __init__(self):
         self._last_is_race_on = 0
 
-    def detect_events(self, packet: TelemetryPacket) -> List:
+    def detect_events(self, packet: TelemetryPacket) -> Tuple:
         """
         Check for state transitions based on current packet.
-        Returns a list of domain events (e.g. RaceStarted).
+        Returns a tuple of domain events (e.g. RaceStarted); empty when nothing changed.
         """
-        events = []
-        
+        is_race_on = packet.is_race_on
+        last = self._last_is_race_on
+        if is_race_on == last:
+            return _NO_EVENTS
+        self._last_is_race_on = is_race_on
+
         # State Machine: IsRaceOn 0 -> 1 (Race Started)
-        if self._last_is_race_on == 0 and packet.is_race_on == 1:
-            events.append(RaceStarted(
+        if last == 0 and is_race_on == 1:
+            return (RaceStarted(
                 timestamp=packet.current_race_time,
                 car_ordinal=packet.car_ordinal,
                 car_class=packet.car_class,
                 car_performance_index=packet.car_performance_index
-            ))
-            
+            ),)
+
         # State Machine: IsRaceOn 1 -> 0 (Race Ended)
-        if self._last_is_race_on == 1 and packet.is_race_on == 0:
-            events.append(RaceStopped(
+        if last == 1 and is_race_on == 0:
+            return (RaceStopped(
                 timestamp=packet.current_race_time
-            ))
-        
-        self._last_is_race_on = packet.is_race_on
-        return events
+            ),)
+
+        return _NO_EVENTS
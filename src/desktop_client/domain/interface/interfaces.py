@@ -29,6 +29,15 @@ class IOutQueue(Protocol):
         """
         ...
 
+    def put_many(self, items: list[TelemetryPacket]) -> int:
+        """
+        Puts a batch of items without blocking, in order — one hand-off per batch.
+
+        Returns:
+            Number of items enqueued. Same capacity semantics as put_nowait().
+        """
+        ...
+
 class IAsyncRunner(Protocol):
     """
     Interface for running an asyncio event loop in a dedicated environment (e.g., background thread).
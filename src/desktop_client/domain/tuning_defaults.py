@@ -14,6 +14,8 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 from typing import Any
 
 from desktop_client.domain.tuning import (
@@ -148,15 +150,36 @@ class TuningDefaults:
             TuningDefaults.get(("tires", "front_pressure_bar"))  # → 2.0
             TuningDefaults.get(("brakes", "balance_pct"))        # → 50.0
         """
-        current: Any = cls.as_dict()
-        for key in model_path:
-            if isinstance(current, dict) and key in current:
-                current = current[key]
-            else:
-                return None
-        return current
+        value = cls._flat().get(tuple(model_path))
+        # Изменяемые узлы (секции, списки передач) отдаём копией — кэш не должен портиться
+        if isinstance(value, (dict, list)):
+            return copy.deepcopy(value)
+        return value
 
     @classmethod
+    @functools.cache
+    def _flat(cls) -> dict[tuple[str, ...], Any]:
+        """
+        Дефолты, развёрнутые в плоский словарь {путь: значение} — один раз на процесс.
+
+        configure_ranges() вызывает get() для каждой привязки (~70 виджетов);
+        без кэша каждый вызов заново строил TuningSetup и делал model_dump().
+        Ключи — все префиксы путей, поэтому get(("tires",)) по-прежнему вернёт секцию.
+        """
+        flat: dict[tuple[str, ...], Any] = {}
+
+        def _walk(node: Any, prefix: tuple[str, ...]) -> None:
+            if prefix:
+                flat[prefix] = node
+            if isinstance(node, dict):
+                for key, child in node.items():
+                    _walk(child, prefix + (key,))
+
+        _walk(cls.as_dict(), ())
+        return flat
+
+    @classmethod
+    @functools.cache
     def get_range(cls, model_path: tuple[str, ...]) -> tuple[float | None, float | None]:
         """
         Читает ge/le (ограничения) поля прямо из метаданных Pydantic v2 по пути в модели.
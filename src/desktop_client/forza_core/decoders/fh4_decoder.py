@@ -60,6 +60,9 @@ _FH4_FORMAT = (
     'fff'  # f32  TireTempFade FL/FR/RL  — only 3 in FH4, 4th is in FH5
 )
 
+# Compiled once at import: unpack_from() skips the per-call format-cache lookup.
+_FH4_STRUCT = struct.Struct(_FH4_FORMAT)
+
 _FH4_EXPECTED_SIZE = 324
 
 
@@ -82,97 +85,6 @@ class Fh4Decoder:
         Raises:
             struct.error — if data is corrupted or truncated.
         """
-        fields = struct.unpack_from(_FH4_FORMAT, data)
-        return RawTelemetry(
-            received_at=received_at,
-            IsRaceOn=fields[0],
-            TimestampMS=fields[1],
-            EngineMaxRpm=fields[2],
-            EngineIdleRpm=fields[3],
-            CurrentEngineRpm=fields[4],
-            AccelerationX=fields[5],
-            AccelerationY=fields[6],
-            AccelerationZ=fields[7],
-            VelocityX=fields[8],
-            VelocityY=fields[9],
-            VelocityZ=fields[10],
-            AngularVelocityX=fields[11],
-            AngularVelocityY=fields[12],
-            AngularVelocityZ=fields[13],
-            Yaw=fields[14],
-            Pitch=fields[15],
-            Roll=fields[16],
-            NormalizedSuspensionTravelFrontLeft=fields[17],
-            NormalizedSuspensionTravelFrontRight=fields[18],
-            NormalizedSuspensionTravelRearLeft=fields[19],
-            NormalizedSuspensionTravelRearRight=fields[20],
-            TireSlipRatioFrontLeft=fields[21],
-            TireSlipRatioFrontRight=fields[22],
-            TireSlipRatioRearLeft=fields[23],
-            TireSlipRatioRearRight=fields[24],
-            WheelRotationSpeedFrontLeft=fields[25],
-            WheelRotationSpeedFrontRight=fields[26],
-            WheelRotationSpeedRearLeft=fields[27],
-            WheelRotationSpeedRearRight=fields[28],
-            WheelOnRumbleStripFrontLeft=fields[29],
-            WheelOnRumbleStripFrontRight=fields[30],
-            WheelOnRumbleStripRearLeft=fields[31],
-            WheelOnRumbleStripRearRight=fields[32],
-            WheelInPuddleDepthFrontLeft=fields[33],
-            WheelInPuddleDepthFrontRight=fields[34],
-            WheelInPuddleDepthRearLeft=fields[35],
-            WheelInPuddleDepthRearRight=fields[36],
-            SurfaceRumbleFrontLeft=fields[37],
-            SurfaceRumbleFrontRight=fields[38],
-            SurfaceRumbleRearLeft=fields[39],
-            SurfaceRumbleRearRight=fields[40],
-            TireSlipAngleFrontLeft=fields[41],
-            TireSlipAngleFrontRight=fields[42],
-            TireSlipAngleRearLeft=fields[43],
-            TireSlipAngleRearRight=fields[44],
-            TireCombinedSlipFrontLeft=fields[45],
-            TireCombinedSlipFrontRight=fields[46],
-            TireCombinedSlipRearLeft=fields[47],
-            TireCombinedSlipRearRight=fields[48],
-            SuspensionTravelMetersFrontLeft=fields[49],
-            SuspensionTravelMetersFrontRight=fields[50],
-            SuspensionTravelMetersRearLeft=fields[51],
-            SuspensionTravelMetersRearRight=fields[52],
-            CarOrdinal=fields[53],
-            CarClass=fields[54],
-            CarPerformanceIndex=fields[55],
-            DrivetrainType=fields[56],
-            NumCylinders=fields[57],
-            PositionX=fields[58],
-            PositionY=fields[59],
-            PositionZ=fields[60],
-            Speed=fields[61],
-            Power=fields[62],
-            Torque=fields[63],
-            TireTempFrontLeft=fields[64],
-            TireTempFrontRight=fields[65],
-            TireTempRearLeft=fields[66],
-            TireTempRearRight=fields[67],
-            Boost=fields[68],
-            Fuel=fields[69],
-            DistanceTraveled=fields[70],
-            BestLap=fields[71],
-            LastLap=fields[72],
-            CurrentLap=fields[73],
-            CurrentRaceTime=fields[74],
-            LapNumber=fields[75],
-            RacePosition=fields[76],
-            Accel=fields[77],
-            Brake=fields[78],
-            Clutch=fields[79],
-            HandBrake=fields[80],
-            Gear=fields[81],
-            Steer=fields[82],
-            NormalizedDrivingLine=fields[83],
-            NormalizedAIBrakeDifference=fields[84],
-            # FH4 extended fields
-            HorizonPlaceholder=fields[85],
-            TireTempFadeFL=fields[86],
-            TireTempFadeFR=fields[87],
-            TireTempFadeRL=fields[88],
-        )
+        # RawTelemetry declares its fields in wire order, so the unpacked tuple maps
+        # positionally — no per-field kwargs dict, no 90 `fields[i]` lookups.
+        return RawTelemetry(received_at, *_FH4_STRUCT.unpack_from(data))
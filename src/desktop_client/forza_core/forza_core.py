@@ -1,7 +1,7 @@
 import logging
 
 from .interfaces import IUdpListener, IPipelineManager
-from ..domain.interface.i_async_runner import IAsyncRunner
+from ..domain.interface.interfaces import IAsyncRunner
 
 logger = logging.getLogger(__name__)
 
@@ -1,6 +1,6 @@
 import struct
 import structlog
-from typing import Tuple, Any
+from typing import Any, ClassVar, Tuple
 from ...domain.interface.i_packet_decoder import IPacketDecoder
 
 logger = structlog.get_logger()
@@ -59,10 +59,12 @@ class PacketDecoder(IPacketDecoder):
         'b'    # s8 DriLine
         'b'    # s8 AIBrakeDiff
     )
+    # Compiled once: unpack_from() on the instance skips the per-call format cache lookup.
+    _STRUCT_V1: ClassVar[struct.Struct] = struct.Struct(_FORMAT_V1)
 
     def decode(self, data: bytes) -> Tuple[Any, ...] | None:
         try:
-             return struct.unpack_from(self._FORMAT_V1, data)
+             return self._STRUCT_V1.unpack_from(data)
         except struct.error as e:
              logger.error("packet_decoder_binary_error", error=str(e), packet_size=len(data))
              return None
@@ -1,6 +1,28 @@
+import dataclasses
+from operator import attrgetter
+
 from .models import RawTelemetry
 from ..domain.models import TelemetryPacket
 
+# Wire fields (RawTelemetry) and domain fields (TelemetryPacket) share the Forza packet
+# order one-to-one. Excluded: received_at (transport metadata), the optional FH4/FH5
+# extras on the raw side and session_id on the domain side — all of them have defaults.
+_RAW_FIELDS: tuple[str, ...] = tuple(
+    f.name for f in dataclasses.fields(RawTelemetry)
+    if f.default is dataclasses.MISSING and f.name != "received_at"
+)
+_DOMAIN_FIELDS: tuple[str, ...] = tuple(
+    f.name for f in dataclasses.fields(TelemetryPacket) if f.default is dataclasses.MISSING
+)
+if len(_RAW_FIELDS) != len(_DOMAIN_FIELDS):
+    raise ImportError(
+        f"RawTelemetry ({len(_RAW_FIELDS)}) and TelemetryPacket ({len(_DOMAIN_FIELDS)}) "
+        "field lists are out of sync"
+    )
+
+# One C-level call returns all field values as a tuple, in _DOMAIN_FIELDS order.
+_extract = attrgetter(*_RAW_FIELDS)
+
 
 class PacketParser:
     """
@@ -21,94 +43,10 @@ class PacketParser:
         """
         Maps RawTelemetry fields to the TelemetryPacket domain model.
 
+        Positional construction from a precompiled attrgetter: no per-field Python
+        bytecode and no keyword matching on the hot path.
+
         Raises:
             TypeError  — if a field has an unexpected type (routed to DLQ as PARSE_ERROR).
         """
-        return TelemetryPacket(
-            IsRaceOn=raw.IsRaceOn,
-            TimestampMS=raw.TimestampMS,
-            EngineMaxRpm=raw.EngineMaxRpm,
-            EngineIdleRpm=raw.EngineIdleRpm,
-            CurrentEngineRpm=raw.CurrentEngineRpm,
-            AccelerationX=raw.AccelerationX,
-            AccelerationY=raw.AccelerationY,
-            AccelerationZ=raw.AccelerationZ,
-            VelocityX=raw.VelocityX,
-            VelocityY=raw.VelocityY,
-            VelocityZ=raw.VelocityZ,
-            AngularVelocityX=raw.AngularVelocityX,
-            AngularVelocityY=raw.AngularVelocityY,
-            AngularVelocityZ=raw.AngularVelocityZ,
-            Yaw=raw.Yaw,
-            Pitch=raw.Pitch,
-            Roll=raw.Roll,
-            NormalizedSuspensionTravelFrontLeft=raw.NormalizedSuspensionTravelFrontLeft,
-            NormalizedSuspensionTravelFrontRight=raw.NormalizedSuspensionTravelFrontRight,
-            NormalizedSuspensionTravelRearLeft=raw.NormalizedSuspensionTravelRearLeft,
-            NormalizedSuspensionTravelRearRight=raw.NormalizedSuspensionTravelRearRight,
-            TireSlipRatioFrontLeft=raw.TireSlipRatioFrontLeft,
-            TireSlipRatioFrontRight=raw.TireSlipRatioFrontRight,
-            TireSlipRatioRearLeft=raw.TireSlipRatioRearLeft,
-            TireSlipRatioRearRight=raw.TireSlipRatioRearRight,
-            WheelRotationSpeedFrontLeft=raw.WheelRotationSpeedFrontLeft,
-            WheelRotationSpeedFrontRight=raw.WheelRotationSpeedFrontRight,
-            WheelRotationSpeedRearLeft=raw.WheelRotationSpeedRearLeft,
-            WheelRotationSpeedRearRight=raw.WheelRotationSpeedRearRight,
-            WheelOnRumbleStripFrontLeft=raw.WheelOnRumbleStripFrontLeft,
-            WheelOnRumbleStripFrontRight=raw.WheelOnRumbleStripFrontRight,
-            WheelOnRumbleStripRearLeft=raw.WheelOnRumbleStripRearLeft,
-            WheelOnRumbleStripRearRight=raw.WheelOnRumbleStripRearRight,
-            WheelInPuddleDepthFrontLeft=raw.WheelInPuddleDepthFrontLeft,
-            WheelInPuddleDepthFrontRight=raw.WheelInPuddleDepthFrontRight,
-            WheelInPuddleDepthRearLeft=raw.WheelInPuddleDepthRearLeft,
-            WheelInPuddleDepthRearRight=raw.WheelInPuddleDepthRearRight,
-            SurfaceRumbleFrontLeft=raw.SurfaceRumbleFrontLeft,
-            SurfaceRumbleFrontRight=raw.SurfaceRumbleFrontRight,
-            SurfaceRumbleRearLeft=raw.SurfaceRumbleRearLeft,
-            SurfaceRumbleRearRight=raw.SurfaceRumbleRearRight,
-            TireSlipAngleFrontLeft=raw.TireSlipAngleFrontLeft,
-            TireSlipAngleFrontRight=raw.TireSlipAngleFrontRight,
-            TireSlipAngleRearLeft=raw.TireSlipAngleRearLeft,
-            TireSlipAngleRearRight=raw.TireSlipAngleRearRight,
-            TireCombinedSlipFrontLeft=raw.TireCombinedSlipFrontLeft,
-            TireCombinedSlipFrontRight=raw.TireCombinedSlipFrontRight,
-            TireCombinedSlipRearLeft=raw.TireCombinedSlipRearLeft,
-            TireCombinedSlipRearRight=raw.TireCombinedSlipRearRight,
-            SuspensionTravelMetersFrontLeft=raw.SuspensionTravelMetersFrontLeft,
-            SuspensionTravelMetersFrontRight=raw.SuspensionTravelMetersFrontRight,
-            SuspensionTravelMetersRearLeft=raw.SuspensionTravelMetersRearLeft,
-            SuspensionTravelMetersRearRight=raw.SuspensionTravelMetersRearRight,
-            CarOrdinal=raw.CarOrdinal,
-            CarClass=raw.CarClass,
-            CarPerformanceIndex=raw.CarPerformanceIndex,
-            DrivetrainType=raw.DrivetrainType,
-            NumCylinders=raw.NumCylinders,
-            HorizonPlaceholder=raw.HorizonPlaceholder,
-            PositionX=raw.PositionX,
-            PositionY=raw.PositionY,
-            PositionZ=raw.PositionZ,
-            Speed=raw.Speed,
-            Power=raw.Power,
-            Torque=raw.Torque,
-            TireTempFrontLeft=raw.TireTempFrontLeft,
-            TireTempFrontRight=raw.TireTempFrontRight,
-            TireTempRearLeft=raw.TireTempRearLeft,
-            TireTempRearRight=raw.TireTempRearRight,
-            Boost=raw.Boost,
-            Fuel=raw.Fuel,
-            DistanceTraveled=raw.DistanceTraveled,
-            BestLap=raw.BestLap,
-            LastLap=raw.LastLap,
-            CurrentLap=raw.CurrentLap,
-            CurrentRaceTime=raw.CurrentRaceTime,
-            LapNumber=raw.LapNumber,
-            RacePosition=raw.RacePosition,
-            Accel=raw.Accel,
-            Brake=raw.Brake,
-            Clutch=raw.Clutch,
-            HandBrake=raw.HandBrake,
-            Gear=raw.Gear,
-            Steer=raw.Steer,
-            NormalizedDrivingLine=raw.NormalizedDrivingLine,
-            NormalizedAIBrakeDifference=raw.NormalizedAIBrakeDifference,
-        )
+        return TelemetryPacket(*_extract(raw))
@@ -1,17 +1,23 @@
+import collections
 import logging
-import queue
 import struct
 import threading
+import time
 from concurrent.futures import ThreadPoolExecutor, Future
 
 from .interfaces import IPacketDecoderFactory, IPacketParser, IPacketValidator
 from .models import RawPacket, ValidationResult
-from ..domain.interface.i_out_queue import IOutQueue
+from ..domain.interface.interfaces import IOutQueue
+from ..domain.models import TelemetryPacket
 
 logger = logging.getLogger(__name__)
 
-# Sentinel value to signal worker shutdown
-_STOP_SENTINEL = None
+# Max packets a worker processes per drain pass before re-checking the InQueue
+_DRAIN_MAX = 256
+
+# At most one DLQ log line per interval: a stream of bad packets (60+ Hz) must not turn
+# into a log storm. Drop counters still count every packet.
+_DLQ_LOG_INTERVAL_SEC = 1.0
 
 
 class PipelineManager:
@@ -29,6 +35,16 @@ class PipelineManager:
       - Manage module lifecycle (ForzaCore's job).
       - Implement business logic (delegated to Decoder / Parser / Validator).
 
+    Inline mode (num_workers=0):
+      enqueue() runs Decode → Parse → Validate directly in the caller — the
+      AsyncioThreadRunner loop thread, which serves only the UDP socket. No InQueue,
+      no thread wakeup per burst; at 60–240 Hz × ~50 μs per packet the loop stays
+      well under 2% busy. Use worker threads when validation becomes CPU-heavy.
+
+    InQueue overflow policy is Drop Oldest (bounded by max_queue): if the workers
+    fall behind, stale samples are evicted and counted (drop.queue_full) instead of
+    the backlog growing without limit.
+
     Dead Letter Queue policy:
       - Unknown packet size → metrics only (drop.unknown_size), no DLQ.
       - Corrupt bytes (struct.error) → DLQ (drop.decode_error) + metrics.
@@ -43,6 +59,7 @@ class PipelineManager:
         validator: IPacketValidator,
         out_queue: IOutQueue,
         num_workers: int = 1,
+        max_queue: int = 10_000,
     ) -> None:
         self._decoder_factory = decoder_factory
         self._parser = parser
@@ -50,21 +67,40 @@ class PipelineManager:
         self._out_queue = out_queue
         self._num_workers = num_workers
 
-        self._in_queue: queue.Queue[RawPacket | None] = queue.Queue()
+        # Bound once: _process() runs per packet, this saves two attribute lookups per step.
+        self._get_decoder = decoder_factory.get_decoder
+        self._parse = parser.parse
+        self._validate = validator.validate
+
+        # InQueue: deque.append()/popleft() are atomic under the GIL, so the producer
+        # (Event Loop thread) and workers share it without a lock. `_ready` is set only
+        # on the empty→non-empty edge — one wakeup per burst, not one notify per packet.
+        self._in_queue: collections.deque[RawPacket] = collections.deque(maxlen=max_queue)
+        self._ready = threading.Event()
+        self._stopping = False
         self._executor: ThreadPoolExecutor | None = None
         self._worker_futures: list[Future] = []
 
         # Lightweight metrics counters
+        self._drops_queue_full: int = 0
         self._drops_unknown_size: int = 0
         self._drops_decode_error: int = 0
         self._drops_parse_error: int = 0
         self._drops_validation_failed: int = 0
         self._packets_processed: int = 0
 
+        # DLQ log throttle
+        self._last_dlq_log: float = float("-inf")
+        self._dlq_suppressed: int = 0
+
     # ------------------------------------------------------------------ lifecycle
 
     def start(self) -> None:
         """Initialises the InQueue and starts Worker thread(s)."""
+        self._stopping = False
+        if self._num_workers == 0:
+            logger.info("PipelineManager: started in inline mode (no workers).")
+            return
         self._executor = ThreadPoolExecutor(
             max_workers=self._num_workers,
             thread_name_prefix="pipeline-worker",
@@ -78,12 +114,11 @@ class PipelineManager:
 
     def stop(self) -> None:
         """
-        Sends stop sentinels to drain the remaining queue and shut down workers.
+        Signals workers to drain the remaining queue and shut down.
         Blocks until all workers have exited.
         """
-        # One sentinel per worker
-        for _ in range(self._num_workers):
-            self._in_queue.put(_STOP_SENTINEL)
+        self._stopping = True
+        self._ready.set()
 
         for future in self._worker_futures:
             try:
@@ -98,8 +133,9 @@ class PipelineManager:
         self._worker_futures.clear()
         logger.info(
             "PipelineManager: stopped. stats=processed=%d "
-            "drops(size=%d decode=%d parse=%d validation=%d)",
+            "drops(queue=%d size=%d decode=%d parse=%d validation=%d)",
             self._packets_processed,
+            self._drops_queue_full,
             self._drops_unknown_size,
             self._drops_decode_error,
             self._drops_parse_error,
@@ -109,33 +145,85 @@ class PipelineManager:
     def enqueue(self, packet: RawPacket) -> None:
         """
         Called by UdpListener via on_packet callback.
-        Places the RawPacket into the InQueue for asynchronous processing.
+        Places the RawPacket into the InQueue for asynchronous processing
+        (or processes it right away in inline mode).
         """
-        self._in_queue.put_nowait(packet)
+        if self._num_workers == 0:
+            telemetry = self._process(packet)
+            if telemetry is not None:
+                self._out_queue.put_nowait(telemetry)
+            return
+        in_queue = self._in_queue
+        if len(in_queue) == in_queue.maxlen:
+            # append() below evicts the oldest packet
+            self._drops_queue_full += 1
+        in_queue.append(packet)
+        # is_set() is a lock-free read; set() (which takes the Condition lock)
+        # only runs when a worker may be sleeping.
+        if not self._ready.is_set():
+            self._ready.set()
 
     # ------------------------------------------------------------------ worker
 
     def _worker_loop(self) -> None:
         """
         Worker thread main loop. Runs Decode → Parse → Validate for each RawPacket.
-        Exits cleanly on sentinel (None) from stop().
+        Exits cleanly once stop() is requested and the InQueue is drained.
+
+        Bulk drain: one wakeup, then popleft() until the InQueue is empty (in passes
+        of up to _DRAIN_MAX so several workers still share a burst).
+
+        Wakeup protocol: clear() happens BEFORE draining — a packet appended after the
+        drain finds the event cleared and sets it again, so no wakeup is lost.
         """
+        in_queue = self._in_queue
+        ready = self._ready
+
         while True:
-            raw_packet = self._in_queue.get()
+            ready.wait()
+            ready.clear()
+            self._drain(in_queue)
 
-            # Shutdown sentinel
-            if raw_packet is _STOP_SENTINEL:
-                self._in_queue.task_done()
-                break
+            if self._stopping:
+                # Packets enqueued before stop() may have landed after the last pass
+                self._drain(in_queue)
+                ready.set()  # wake the remaining workers so they can exit too
+                return
 
-            self._process(raw_packet)
-            self._in_queue.task_done()
+    def _drain(self, in_queue: collections.deque) -> None:
+        """
+        Processes everything queued, pass by pass. Valid packets of a pass are handed
+        to the OutQueue together — one put_many() (one lock) per pass, not per packet.
+        """
+        popleft = in_queue.popleft
+        process = self._process
+        put_many = self._out_queue.put_many
+        while True:
+            batch: list[RawPacket] = []
+            try:
+                for _ in range(_DRAIN_MAX):
+                    batch.append(popleft())
+            except IndexError:
+                pass
 
-    def _process(self, raw_packet: RawPacket) -> None:
+            accepted: list[TelemetryPacket] = []
+            accept = accepted.append
+            for raw_packet in batch:
+                telemetry = process(raw_packet)
+                if telemetry is not None:
+                    accept(telemetry)
+            if accepted:
+                put_many(accepted)
+
+            if len(batch) < _DRAIN_MAX:
+                return
+
+    def _process(self, raw_packet: RawPacket) -> TelemetryPacket | None:
+        """Decode → Parse → Validate one packet. Returns the valid TelemetryPacket or None (dropped)."""
         data = raw_packet.data
 
         # ④ Decode — find the right decoder by packet size
-        decoder = self._decoder_factory.get_decoder(len(data))
+        decoder = self._get_decoder(len(data))
         if decoder is None:
             self._drops_unknown_size += 1
             logger.debug(
@@ -150,7 +238,7 @@ class PipelineManager:
             self._log_dlq(
                 reason="DECODE_ERROR",
                 payload=data,
-                detail=str(exc),
+                detail=exc,
             )
             return
         except Exception as exc:
@@ -158,20 +246,20 @@ class PipelineManager:
             self._log_dlq(
                 reason="DECODE_ERROR",
                 payload=data,
-                detail=f"unexpected: {exc}",
+                detail=exc,
             )
             return
 
 
         # ⑤ Parse — RawTelemetry → TelemetryPacket
         try:
-            packet = self._parser.parse(raw_telemetry)
+            packet = self._parse(raw_telemetry)
         except (struct.error, TypeError) as exc:
             self._drops_parse_error += 1
             self._log_dlq(
                 reason="PARSE_ERROR",
                 payload=raw_telemetry,
-                detail=str(exc),
+                detail=exc,
             )
             return
         except Exception as exc:
@@ -179,12 +267,12 @@ class PipelineManager:
             self._log_dlq(
                 reason="PARSE_ERROR",
                 payload=raw_telemetry,
-                detail=f"unexpected: {exc}",
+                detail=exc,
             )
             return
 
         # ⑥ Validate — full Chain of Responsibility
-        result: ValidationResult = self._validator.validate(packet)
+        result: ValidationResult = self._validate(packet)
         if not result.is_valid:
             self._drops_validation_failed += 1
             self._log_dlq(
@@ -194,18 +282,26 @@ class PipelineManager:
             )
             return
 
-        # ✅ Happy path — push to OutQueue
-        self._out_queue.put_nowait(packet)
+        # ✅ Happy path — caller pushes to OutQueue
         self._packets_processed += 1
+        return packet
 
-    @staticmethod
-    def _log_dlq(reason: str, payload: object, detail: str) -> None:
+    def _log_dlq(self, reason: str, payload: object, detail: object) -> None:
         """
         Dead Letter Queue: logs the rejected payload for debugging.
         On first implementation this is a structured log warning.
         Can be replaced with a file/queue DLQ writer via interface injection.
+
+        Throttled to one line per _DLQ_LOG_INTERVAL_SEC; the next line reports how many
+        entries were suppressed. `detail` (often the exception) is only formatted when logged.
         """
+        now = time.monotonic()
+        if now - self._last_dlq_log < _DLQ_LOG_INTERVAL_SEC:
+            self._dlq_suppressed += 1
+            return
+        self._last_dlq_log = now
+        suppressed, self._dlq_suppressed = self._dlq_suppressed, 0
         logger.warning(
-            "PipelineManager: DLQ reason=%s detail=%s payload_type=%s",
-            reason, detail, type(payload).__name__,
+            "PipelineManager: DLQ reason=%s detail=%r payload_type=%s suppressed=%d",
+            reason, detail, type(payload).__name__, suppressed,
         )
@@ -16,33 +16,33 @@ class ConsistencyCheck:
         """
         # If engine is running (rpm > 0), gear must be >= 0.
         # Gear=0 is neutral which is valid, but negative gear is not.
-        if packet.CurrentEngineRpm > 0 and packet.Gear < 0:
+        if packet.current_engine_rpm > 0 and packet.gear < 0:
             return ValidationResult.fail(
-                f"Invalid gear {packet.Gear} while engine is running "
-                f"(rpm={packet.CurrentEngineRpm:.0f})"
+                f"Invalid gear {packet.gear} while engine is running "
+                f"(rpm={packet.current_engine_rpm:.0f})"
             )
 
         # MaxRpm must be >= IdleRpm when engine is active
-        if packet.EngineMaxRpm > 0 and packet.EngineIdleRpm > packet.EngineMaxRpm:
+        if packet.engine_max_rpm > 0 and packet.engine_idle_rpm > packet.engine_max_rpm:
             return ValidationResult.fail(
-                f"EngineIdleRpm ({packet.EngineIdleRpm:.0f}) > "
-                f"EngineMaxRpm ({packet.EngineMaxRpm:.0f})"
+                f"EngineIdleRpm ({packet.engine_idle_rpm:.0f}) > "
+                f"EngineMaxRpm ({packet.engine_max_rpm:.0f})"
             )
 
         # CurrentEngineRpm must not exceed MaxRpm (with 5% tolerance for transients)
         if (
-            packet.EngineMaxRpm > 0
-            and packet.CurrentEngineRpm > packet.EngineMaxRpm * 1.05
+            packet.engine_max_rpm > 0
+            and packet.current_engine_rpm > packet.engine_max_rpm * 1.05
         ):
             return ValidationResult.fail(
-                f"CurrentEngineRpm ({packet.CurrentEngineRpm:.0f}) exceeds "
-                f"EngineMaxRpm ({packet.EngineMaxRpm:.0f}) by >5%"
+                f"CurrentEngineRpm ({packet.current_engine_rpm:.0f}) exceeds "
+                f"EngineMaxRpm ({packet.engine_max_rpm:.0f}) by >5%"
             )
 
         # Drivetrain type must be one of: 0=FWD, 1=RWD, 2=AWD
-        if packet.DrivetrainType not in (0, 1, 2):
+        if packet.drivetrain_type not in (0, 1, 2):
             return ValidationResult.fail(
-                f"Unknown DrivetrainType: {packet.DrivetrainType} (expected 0, 1, or 2)"
+                f"Unknown DrivetrainType: {packet.drivetrain_type} (expected 0, 1, or 2)"
             )
 
         return ValidationResult.ok()
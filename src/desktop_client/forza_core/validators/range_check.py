@@ -23,38 +23,38 @@ class RangeCheck:
         """
         Runs all range checks. Returns the first failure or ok.
         """
-        if not (0.0 <= packet.Speed <= self._MAX_SPEED_MPS):
+        if not (0.0 <= packet.speed_mps <= self._MAX_SPEED_MPS):
             return ValidationResult.fail(
-                f"Speed out of range: {packet.Speed:.2f} m/s (max {self._MAX_SPEED_MPS})"
+                f"Speed out of range: {packet.speed_mps:.2f} m/s (max {self._MAX_SPEED_MPS})"
             )
 
-        if not (0.0 <= packet.CurrentEngineRpm <= self._MAX_RPM):
+        if not (0.0 <= packet.current_engine_rpm <= self._MAX_RPM):
             return ValidationResult.fail(
-                f"CurrentEngineRpm out of range: {packet.CurrentEngineRpm:.0f} "
+                f"CurrentEngineRpm out of range: {packet.current_engine_rpm:.0f} "
                 f"(0..{self._MAX_RPM:.0f})"
             )
 
-        if not (0.0 <= packet.EngineMaxRpm <= self._MAX_RPM):
+        if not (0.0 <= packet.engine_max_rpm <= self._MAX_RPM):
             return ValidationResult.fail(
-                f"EngineMaxRpm out of range: {packet.EngineMaxRpm:.0f}"
+                f"EngineMaxRpm out of range: {packet.engine_max_rpm:.0f}"
             )
 
-        if not (0.0 <= packet.Fuel <= self._MAX_FUEL):
+        if not (0.0 <= packet.fuel <= self._MAX_FUEL):
             return ValidationResult.fail(
-                f"Fuel out of range: {packet.Fuel:.3f} (expected 0..1)"
+                f"Fuel out of range: {packet.fuel:.3f} (expected 0..1)"
             )
 
-        if packet.CarPerformanceIndex != 0 and not (
-            self._MIN_PI <= packet.CarPerformanceIndex <= self._MAX_PI
+        if packet.car_performance_index != 0 and not (
+            self._MIN_PI <= packet.car_performance_index <= self._MAX_PI
         ):
             return ValidationResult.fail(
-                f"CarPerformanceIndex out of range: {packet.CarPerformanceIndex} "
+                f"CarPerformanceIndex out of range: {packet.car_performance_index} "
                 f"({self._MIN_PI}..{self._MAX_PI})"
             )
 
-        if not (0 <= packet.Gear <= 15):
+        if not (0 <= packet.gear <= 15):
             return ValidationResult.fail(
-                f"Gear out of range: {packet.Gear} (0..15)"
+                f"Gear out of range: {packet.gear} (0..15)"
             )
 
         return ValidationResult.ok()
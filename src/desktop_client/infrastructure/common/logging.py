@@ -1,8 +1,15 @@
+import atexit
+import queue
+import orjson
 import structlog
 import logging
+import logging.handlers
 import sys
 from typing import Any, MutableMapping
 
+# Background thread that performs the actual stream I/O (see setup_logging).
+_listener: logging.handlers.QueueListener | None = None
+
 def _security_filter(logger: Any, method_name: str, event_dict: MutableMapping[str, Any]) -> MutableMapping[str, Any]:
     """
     Filter sensitive keys from logs.
@@ -13,37 +20,71 @@ def _security_filter(logger: Any, method_name: str, event_dict: MutableMapping[s
             event_dict[key] = "***"
     return event_dict
 
+def _orjson_dumps(obj: Any, default: Any = None, **_: Any) -> str:
+    """JSONRenderer serializer: orjson (C) instead of stdlib json; str for the stdlib handler."""
+    return orjson.dumps(obj, default=default).decode()
+
+def _stop_listener() -> None:
+    """Flushes queued records and joins the listener thread (re-setup / interpreter exit)."""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+
+atexit.register(_stop_listener)
+
 def setup_logging(env: str) -> None:
     """
     Configure structlog based on environment.
+
+    structlog events and plain stdlib records (logging.getLogger) share one processor
+    chain and one renderer, so both come out in the same format.
     """
-    processors = [
+    shared_processors = [
         structlog.processors.TimeStamper(fmt="iso"),
         structlog.stdlib.add_log_level,
         _security_filter,
     ]
 
     if env in ("local", "development"):
-        # Development: Colored Console
-        processors.extend([
-            structlog.dev.ConsoleRenderer()
-        ])
+        # Development: Colored Console.
+        # Colour codes only for an interactive terminal — when stdout is piped/redirected
+        # (IDE run, service, `> file`) the ANSI styling is skipped instead of written out.
+        renderer = structlog.dev.ConsoleRenderer(colors=sys.stdout.isatty())
+        render_chain = [renderer]
     else:
         # Production: JSON
-        processors.extend([
-            structlog.processors.JSONRenderer()
-        ])
+        renderer = structlog.processors.JSONRenderer(serializer=_orjson_dumps)
+        # exc_info → "exception" string: orjson cannot serialize a traceback object.
+        render_chain = [structlog.processors.format_exc_info, renderer]
 
     structlog.configure(
-        processors=processors,
+        processors=[*shared_processors, structlog.stdlib.ProcessorFormatter.wrap_for_formatter],
         logger_factory=structlog.stdlib.LoggerFactory(),
-        wrapper_class=structlog.stdlib.BoundLogger,
+        # Level check happens in the bound logger itself: disabled levels (debug) are
+        # no-op methods — no event dict, no processor chain.
+        wrapper_class=structlog.make_filtering_bound_logger(logging.INFO),
         cache_logger_on_first_use=True,
     )
 
-    # Configure standard logging to redirect to structlog
-    logging.basicConfig(
-        format="%(message)s",
-        stream=sys.stdout,
-        level=logging.INFO,
-    )
+    # Configure standard logging to redirect to structlog.
+    # Rendering still happens in the calling thread — QueueHandler.prepare() formats the
+    # record before enqueueing it. Only the blocking stdout write moves to the
+    # QueueListener thread, off the event loop / pipeline threads.
+    global _listener
+    _stop_listener()
+
+    queue_handler = logging.handlers.QueueHandler(queue.SimpleQueue())
+    queue_handler.setFormatter(structlog.stdlib.ProcessorFormatter(
+        processors=[structlog.stdlib.ProcessorFormatter.remove_processors_meta, *render_chain],
+        foreign_pre_chain=shared_processors,
+    ))
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(logging.Formatter("%(message)s"))
+
+    root = logging.getLogger()
+    root.handlers[:] = [queue_handler]
+    root.setLevel(logging.INFO)
+
+    _listener = logging.handlers.QueueListener(queue_handler.queue, stream_handler, respect_handler_level=True)
+    _listener.start()
@@ -1,11 +1,12 @@
 """
 Infrastructure layer implementation for configuration management.
 """
-import json
 import logging
 from pathlib import Path
 from typing import Any
 
+import orjson
+
 from desktop_client.application.exceptions import SecurityViolationError
 
 logger = logging.getLogger(__name__)
@@ -75,12 +76,12 @@ class LocalConfigRepository:
             )
             
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                data = json.load(f)
-                if not isinstance(data, dict):
-                    return {}
-                return data
-        except (json.JSONDecodeError, OSError) as e:
+            # Parse straight from UTF-8 bytes with the C decoder — no text-mode decode pass
+            data = orjson.loads(file_path.read_bytes())
+            if not isinstance(data, dict):
+                return {}
+            return data
+        except (orjson.JSONDecodeError, OSError) as e:
             logger.warning(f"Failed to read or decode configuration file '{self.filename}': {e}")
             return {}
 
@@ -99,5 +100,5 @@ class LocalConfigRepository:
         # Ensure parent directory exists
         file_path.parent.mkdir(parents=True, exist_ok=True)
         
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=4, ensure_ascii=False)
+        # orjson serialises straight to UTF-8 bytes (C encoder, no ensure_ascii escaping)
+        file_path.write_bytes(orjson.dumps(data, option=orjson.OPT_INDENT_2))
@@ -1,21 +1,43 @@
 import asyncio
 import logging
+import os
 import threading
 from typing import Coroutine, Any, TypeVar
 
 from desktop_client.domain.interface.interfaces import IAsyncRunner
 
+# libuv-backed loop: uvloop on Linux/macOS, winloop (uvloop port) on Windows.
+try:
+    import uvloop as libuv_loop
+except ImportError:
+    try:
+        import winloop as libuv_loop
+    except ImportError:  # not installed — stock asyncio loop
+        libuv_loop = None
+
 logger = logging.getLogger(__name__)
 
 T = TypeVar('T')
 
+# Opt-in scheduling for the loop thread: SCHED_RR preempts the GUI thread and GC-heavy
+# work, so the kernel receive queue keeps draining. Falls back to a lower nice value.
+_REALTIME_PRIORITY = 20
+_FALLBACK_NICE = -10
+
 class AsyncioThreadRunner(IAsyncRunner):
     """
     Manages a dedicated asyncio Event Loop running in a background OS thread.
     This resolves SRP violation by moving infrastructure lifecycle out of the application facade.
+
+    Uses a libuv loop (uvloop / winloop) when one is installed — the loop hosting the
+    UDP receive path — and falls back to the stock asyncio loop otherwise.
+
+    With realtime=True the loop thread asks for realtime scheduling (Linux only; needs
+    CAP_SYS_NICE or a matching RLIMIT_RTPRIO, otherwise it falls back to nice).
     """
-    def __init__(self):
-        self._loop = asyncio.new_event_loop()
+    def __init__(self, realtime: bool = False):
+        self._realtime = realtime
+        self._loop = libuv_loop.new_event_loop() if libuv_loop is not None else asyncio.new_event_loop()
         self._loop_thread = threading.Thread(target=self._run_event_loop, daemon=True)
 
     def start(self) -> None:
@@ -25,14 +47,34 @@ class AsyncioThreadRunner(IAsyncRunner):
 
     def _run_event_loop(self) -> None:
         """Runs the asyncio event loop in a dedicated background thread."""
-        logger.info("AsyncioThreadRunner: event loop thread started.")
+        logger.info(f"AsyncioThreadRunner: event loop thread started ({type(self._loop).__module__}).")
         asyncio.set_event_loop(self._loop)
+        if self._realtime:
+            self._raise_thread_priority()
         try:
             self._loop.run_forever()
         finally:
             self._loop.close()
             logger.info("AsyncioThreadRunner: event loop thread stopped.")
 
+    @staticmethod
+    def _raise_thread_priority() -> None:
+        """Applies to the calling thread: on Linux pid 0 / nice() address the thread, not the process."""
+        if not hasattr(os, "sched_setscheduler"):
+            logger.warning("AsyncioThreadRunner: realtime scheduling is not supported on this platform.")
+            return
+        try:
+            os.sched_setscheduler(0, os.SCHED_RR, os.sched_param(_REALTIME_PRIORITY))
+            logger.info(f"AsyncioThreadRunner: loop thread scheduled SCHED_RR (priority {_REALTIME_PRIORITY}).")
+            return
+        except PermissionError:
+            pass
+        try:
+            os.nice(_FALLBACK_NICE)
+            logger.info(f"AsyncioThreadRunner: SCHED_RR not permitted, loop thread niced to {_FALLBACK_NICE}.")
+        except PermissionError:
+            logger.warning("AsyncioThreadRunner: no permission to raise loop thread priority — running at default.")
+
     def submit(self, coro: Coroutine[Any, Any, T]) -> asyncio.Future[T]:
         """Schedules a coroutine from another thread and returns a concurrent.futures.Future."""
         return asyncio.run_coroutine_threadsafe(coro, self._loop)
@@ -60,5 +102,9 @@ class AsyncioThreadRunner(IAsyncRunner):
             task.cancel()
 
         if tasks:
-            # wait for all tasks to finish cancellation, catching CancelledError safely via return_exceptions
-            await asyncio.gather(*tasks, return_exceptions=True)
+            # wait() works on the task list directly (no gathering future / per-task result list);
+            # it never raises, so CancelledError from the cancelled tasks stays contained.
+            done, _ = await asyncio.wait(tasks)
+            for task in done:
+                if not task.cancelled() and task.exception() is not None:
+                    logger.error(f"Task {task.get_name()} failed during shutdown: {task.exception()!r}")
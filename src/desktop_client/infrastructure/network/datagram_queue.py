@@ -0,0 +1,61 @@
+import asyncio
+from collections import deque
+from typing import Any, List, Optional
+
+
+class DatagramQueue:
+    """
+    Single-loop UDP hand-off queue: collections.deque + asyncio.Event.
+
+    Producer (DatagramProtocol) and consumer live on the same event loop thread,
+    so asyncio.Queue's Future/waiter bookkeeping on every put/get is pure overhead.
+    put_nowait() is a single append; the consumer wakes once per burst and
+    takes everything that arrived with get_batch().
+
+    Overflow policy is Drop Oldest: for live telemetry the newest sample wins, and a
+    stalled consumer costs history instead of fresh data. Evictions are counted in
+    dropped_total.
+
+    Not thread-safe — use from the owning event loop only.
+    """
+
+    def __init__(self, maxsize: int = 10000):
+        self._dq: deque = deque(maxlen=maxsize)
+        self.dropped_total = 0
+        self._has_data = asyncio.Event()
+
+    def put_nowait(self, item: Any) -> bool:
+        """
+        Append an item; never rejects it.
+
+        Returns False when the queue was full and the oldest item was evicted to make room.
+        """
+        dq = self._dq
+        evicted = len(dq) == dq.maxlen
+        dq.append(item)
+        if not self._has_data.is_set():
+            self._has_data.set()
+        if evicted:
+            self.dropped_total += 1
+            return False
+        return True
+
+    async def get_batch(self, max_items: Optional[int] = None) -> List[Any]:
+        """
+        Wait until at least one item is queued, then take them in FIFO order.
+
+        max_items caps the batch size; whatever is left stays queued and the next
+        call returns immediately.
+        """
+        await self._has_data.wait()
+        dq = self._dq
+        if max_items is not None and len(dq) > max_items:
+            popleft = dq.popleft
+            return [popleft() for _ in range(max_items)]
+        batch = list(dq)
+        dq.clear()
+        self._has_data.clear()
+        return batch
+
+    def __len__(self) -> int:
+        return len(self._dq)
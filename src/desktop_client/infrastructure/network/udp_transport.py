@@ -1,26 +1,32 @@
 import asyncio
-import logging
 import time
 from typing import Optional, Tuple
 
+import structlog
+
 try:
     from typing import override
 except ImportError:
     from typing_extensions import override
 
+from desktop_client.infrastructure.network.datagram_queue import DatagramQueue
 from desktop_client.validation import PacketValidator
 
-logger = logging.getLogger(__name__)
+logger = structlog.get_logger(__name__)
+
+# Minimum gap between two drop warnings (seconds).
+_DROP_LOG_INTERVAL_SEC = 1.0
 
 class UdpListener(asyncio.DatagramProtocol):
     """
     High-performance UDP listener for Forza Telemetry.
     Implements 'Fail Fast' rule: drops invalid packets immediately.
     """
-    def __init__(self, queue: asyncio.Queue, validator: PacketValidator):
+    def __init__(self, queue: DatagramQueue, validator: PacketValidator):
         self.queue = queue
+        self._put = queue.put_nowait
         self._validator = validator
-        self._last_error_log_time = 0.0
+        self._last_error_log_time = float("-inf")
         self.dropped_packets = 0
 
     @override
@@ -36,8 +42,8 @@ class UdpListener(asyncio.DatagramProtocol):
         result = self._validator.validate(data)
         if not result.is_valid:
             self.dropped_packets += 1
-            now = time.time()
-            if now - self._last_error_log_time >= 1.0:
+            now = time.monotonic()
+            if now - self._last_error_log_time >= _DROP_LOG_INTERVAL_SEC:
                 logger.warning(
                     "udp_packet_dropped", 
                     reason=result.errors[0].message, 
@@ -47,14 +53,12 @@ class UdpListener(asyncio.DatagramProtocol):
                 self._last_error_log_time = now
             return
 
-        # 2. Push to queue (Drop Tail if full)
-        try:
-            self.queue.put_nowait((data, addr))
-        except asyncio.QueueFull:
+        # 2. Push to queue (Drop Oldest if full — the newest sample always gets in)
+        if not self._put((data, addr)):
             self.dropped_packets += 1
-            now = time.time()
-            if now - self._last_error_log_time >= 1.0:
-                logger.warning("udp_queue_full_dropped_packet")
+            now = time.monotonic()
+            if now - self._last_error_log_time >= _DROP_LOG_INTERVAL_SEC:
+                logger.warning("udp_queue_full_dropped_oldest")
                 self._last_error_log_time = now
 
     @override
@@ -11,10 +11,18 @@ class SignalBus(QObject):
     backend_error_occurred = Signal(BackendErrorEvent)
     # Add only cross-module global events here to avoid "God Object" anti-pattern.
 
+    def __init__(self, parent: QObject | None = None) -> None:
+        super().__init__(parent)
+        # Event type → signal. Register every new Signal here as well.
+        self._routes = {
+            BackendErrorEvent: self.backend_error_occurred,
+        }
+
     def emit(self, event: Any) -> None:
         """
         Implementation of IEventBus.emit.
-        Routes domain events to specific PySide6 signals.
+        Routes domain events to specific PySide6 signals (one dict lookup on the exact type).
         """
-        if isinstance(event, BackendErrorEvent):
-            self.backend_error_occurred.emit(event)
+        signal = self._routes.get(type(event))
+        if signal is not None:
+            signal.emit(event)
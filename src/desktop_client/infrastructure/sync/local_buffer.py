@@ -19,22 +19,23 @@ class LocalBuffer(IBuffer):
             self._queue.append(packet)
             return True
 
+    def put_many(self, packets: List[Any]) -> int:
+        """Enqueue a batch under a single lock acquisition (same drop-oldest semantics)."""
+        with self._lock:
+            self._queue.extend(packets)
+            return len(packets)
+
     def take_batch(self, n: int) -> List[Any]:
         with self._lock:
             if self._pending_batch:
                 return list(self._pending_batch)  # shallow copy — caller cannot mutate internal state
 
-            batch = []
-            for _ in range(min(n, len(self._queue))):
-                batch.append(self._queue.popleft())
-
-            self._pending_batch = batch
+            self._pending_batch = self._detach(n)
             return list(self._pending_batch)  # shallow copy
 
     def take_all_remaining(self) -> List[Any]:
         with self._lock:
-            self._pending_batch.extend(self._queue)
-            self._queue.clear()
+            self._pending_batch.extend(self._detach(len(self._queue)))
             return list(self._pending_batch)  # shallow copy — caller cannot mutate internal state
 
     @contextmanager
@@ -85,6 +86,19 @@ class LocalBuffer(IBuffer):
     # Internal helpers — not part of the public API
     # ------------------------------------------------------------------
 
+    def _detach(self, n: int) -> List[Any]:
+        """Remove up to *n* oldest items from the queue. Caller must hold ``_lock``.
+
+        Taking the whole queue swaps in a fresh deque (O(1) under the lock) instead
+        of popping item by item.
+        """
+        queue = self._queue
+        if n >= len(queue):
+            self._queue = deque(maxlen=self._maxsize)
+            return list(queue)
+        popleft = queue.popleft
+        return [popleft() for _ in range(n)]
+
     def _commit(self) -> None:
         with self._lock:
             self._pending_batch.clear()
@@ -1,4 +1,5 @@
 import asyncio
+import orjson
 import structlog
 import aiohttp
 from typing import Any, Callable, List, Optional
@@ -9,6 +10,8 @@ from desktop_client.domain.events import BackendErrorEvent
 
 logger = structlog.get_logger(__name__)
 
+_JSON_HEADERS = {"Content-Type": "application/json"}
+
 
 class SyncWorker(ISyncWorker):
     """Sends telemetry batches to the backend REST API.
@@ -41,6 +44,8 @@ class SyncWorker(ISyncWorker):
         self.interval_sec = interval_sec
         self._event_bus = event_bus
         self._is_running: bool = False
+        # Set by stop(): wakes the send loop out of its inter-tick wait immediately.
+        self._stop_event = asyncio.Event()
         self._task: Optional[asyncio.Task] = None
         self._session: Optional[aiohttp.ClientSession] = None
 
@@ -48,6 +53,7 @@ class SyncWorker(ISyncWorker):
         if self._is_running:
             return
         self._is_running = True
+        self._stop_event.clear()
         # Strict lifecycle: session is created here and only here.
         # ClientTimeout covers DNS resolution + TCP handshake + total request.
         self._session = aiohttp.ClientSession(
@@ -56,9 +62,21 @@ class SyncWorker(ISyncWorker):
         self._task = asyncio.create_task(self._run_loop())
 
     async def _run_loop(self) -> None:
+        # Fixed-rate schedule: ticks are anchored to deadlines, so the time spent
+        # sending a batch does not stretch the period (sleep(interval) would drift).
+        loop = asyncio.get_running_loop()
+        deadline = loop.time()
         while self._is_running:
             try:
-                await asyncio.sleep(self.interval_sec)
+                deadline += self.interval_sec
+                now = loop.time()
+                if deadline < now:
+                    # Fell behind (slow backend) — skip missed ticks instead of bursting.
+                    deadline = now
+                try:
+                    await asyncio.wait_for(self._stop_event.wait(), deadline - now)
+                except asyncio.TimeoutError:
+                    pass
 
                 # Если во время сна вызвали stop(), не забираем новую пачку
                 if not self._is_running:
@@ -82,8 +100,9 @@ class SyncWorker(ISyncWorker):
     async def _send_batch(self, batch: List[Any]) -> bool:
         assert self._session is not None, "SyncWorker.start() must be called before sending data"
         try:
-            payload = self._serializer(batch)
-            async with self._session.post(self.api_url, json=payload) as response:
+            # orjson encodes straight to bytes — no str round-trip as with json= (stdlib json).
+            payload = orjson.dumps(self._serializer(batch))
+            async with self._session.post(self.api_url, data=payload, headers=_JSON_HEADERS) as response:
                 if response.status not in (200, 201):
                     logger.warning("Backend error response", status=response.status)
                     if self._event_bus:
@@ -140,6 +159,7 @@ class SyncWorker(ISyncWorker):
 
     async def stop(self) -> None:
         self._is_running = False
+        self._stop_event.set()
         if self._task:
             try:
                 await self._task
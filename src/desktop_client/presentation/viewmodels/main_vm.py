@@ -9,6 +9,12 @@ from desktop_client.application.state import SessionFlowManager, MainFlowManager
 from desktop_client.domain.models import SessionState, MainState
 from desktop_client.presentation.resources.strings import UIStrings
 
+# Session error messages are fixed — formatted once at import, not on every failure.
+_ERR_START_CONNECTION = UIStrings.ERR_GENERIC.format("Network or system connection problem.")
+_ERR_START_INTERNAL = UIStrings.ERR_GENERIC.format("Internal application error.")
+_ERR_STOP_CONNECTION = UIStrings.ERR_GENERIC.format("Failed to stop session cleanly.")
+_ERR_STOP_INTERNAL = UIStrings.ERR_GENERIC.format("Internal error during session stop.")
+
 
 class MainViewModel(QObject):
     """
@@ -75,12 +81,12 @@ class MainViewModel(QObject):
         except (ConnectionError, OSError, TimeoutError, ValueError) as e:
             # Expected domain errors: network/IO problems or bad telemetry config.
             _logger.error(f"start_recording: expected domain error: {e}", exc_info=True)
-            self.error_occurred.emit(UIStrings.ERR_GENERIC.format("Network or system connection problem."))
+            self.error_occurred.emit(_ERR_START_CONNECTION)
             self._session_flow.set_state(SessionState.ERROR)
         except Exception as e:
             # Unexpected programming error inside a fire-and-forget task.
             _logger.error("start_recording: unexpected error", exc_info=True)
-            self.error_occurred.emit(UIStrings.ERR_GENERIC.format("Internal application error."))
+            self.error_occurred.emit(_ERR_START_INTERNAL)
             self._session_flow.set_state(SessionState.ERROR)
 
     async def stop_recording(self) -> None:
@@ -95,12 +101,12 @@ class MainViewModel(QObject):
         except (ConnectionError, OSError, TimeoutError, ValueError) as e:
             # Expected domain errors during flush/stop.
             _logger.error(f"stop_recording: expected domain error: {e}", exc_info=True)
-            self.error_occurred.emit(UIStrings.ERR_GENERIC.format("Failed to stop session cleanly."))
+            self.error_occurred.emit(_ERR_STOP_CONNECTION)
             self._session_flow.set_state(SessionState.ERROR)
         except Exception as e:
             # Unexpected programming error inside a fire-and-forget task.
             _logger.error("stop_recording: unexpected error", exc_info=True)
-            self.error_occurred.emit(UIStrings.ERR_GENERIC.format("Internal error during session stop."))
+            self.error_occurred.emit(_ERR_STOP_INTERNAL)
             self._session_flow.set_state(SessionState.ERROR)
 
     def shutdown(self) -> None:
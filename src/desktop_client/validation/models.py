@@ -17,13 +17,13 @@ class ValidationErrorCode(str, Enum):
     NOT_A_DATACLASS = "not_a_dataclass"
     SCHEMA_ERROR = "schema_error"
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValidationError:
     code: ValidationErrorCode | str
     message: str
     location: str | None = None
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True)
 class ValidationResult(Generic[T]):
     is_valid: bool
     data: T | None = None
@@ -2,11 +2,13 @@
 import asyncio
 import logging
 import signal
+import socket
 import sys
 
 # Third-party imports
 import qasync
 from pydantic import ValidationError
+from PySide6.QtCore import QSocketNotifier
 from PySide6.QtWidgets import QApplication
 
 # Application configuration
@@ -22,10 +24,12 @@ from desktop_client.infrastructure.local_config_repository import LocalConfigRep
 from desktop_client.application.config_data_manager import ConfigDataManager
 from desktop_client.application.config_validator_service import ConfigValidatorService
 from desktop_client.application.services.telemetry_manager import TelemetryManager
+from desktop_client.infrastructure.common.logging import setup_logging
 from desktop_client.infrastructure.sync.local_buffer import LocalBuffer
 from desktop_client.infrastructure.sync.sync_worker import SyncWorker
 from desktop_client.application.services.core_facade import RealCoreFacade
 from desktop_client.application.mappers.telemetry_mapper import serialize_batch
+from desktop_client.infrastructure.network.datagram_queue import DatagramQueue
 from desktop_client.infrastructure.network.udp_transport import UdpListener
 
 # Presentation layer
@@ -42,10 +46,53 @@ from desktop_client.application.state.config_flow import ConfigFlowManager
 from desktop_client.application.state.library_flow import LibraryFlowManager
 from desktop_client.presentation.viewmodels.config_library_viewmodel import ConfigLibraryViewModel
 
-# Configure basic logging
+# Bootstrap logging until settings are loaded (then setup_logging takes over)
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Signals that request a graceful shutdown, resolved once at import.
+# SIGBREAK (Ctrl+Break) exists only on Windows; SIGTERM comes from service managers / docker.
+SHUTDOWN_SIGNALS: tuple[signal.Signals, ...] = tuple(
+    getattr(signal, name) for name in ("SIGINT", "SIGTERM", "SIGBREAK") if hasattr(signal, name)
+)
+
+
+def install_signal_wakeup(app: QApplication) -> tuple[QSocketNotifier, socket.socket, socket.socket]:
+    """
+    Wakes the Qt event loop when a signal arrives.
+
+    Python runs signal handlers only between bytecodes, which never happens while the
+    loop sleeps inside Qt's C++ code. set_wakeup_fd() makes the C-level handler write
+    a byte to a socketpair; QSocketNotifier turns that into a Qt event, so the handler
+    runs immediately — no periodic polling timer.
+
+    The caller must keep the returned objects alive for the lifetime of the loop.
+    """
+    rsock, wsock = socket.socketpair()
+    rsock.setblocking(False)
+    wsock.setblocking(False)
+    signal.set_wakeup_fd(wsock.fileno())
+
+    def _drain() -> None:
+        try:
+            while rsock.recv(64):
+                pass
+        except (BlockingIOError, InterruptedError):
+            pass
+
+    notifier = QSocketNotifier(rsock.fileno(), QSocketNotifier.Type.Read, app)
+    notifier.activated.connect(_drain)
+    return notifier, rsock, wsock
+
+
+def uninstall_signal_wakeup(notifier: QSocketNotifier, rsock: socket.socket, wsock: socket.socket) -> None:
+    """Reverses install_signal_wakeup(): detaches the wakeup fd, then releases the notifier and sockets."""
+    signal.set_wakeup_fd(-1)
+    notifier.setEnabled(False)
+    rsock.close()
+    wsock.close()
+
+
 def setup_environment():
     """Sets up the environment for the application."""
     if str(BASE_DIR) not in sys.path:
@@ -56,15 +103,10 @@ def log_secure_validation_error(e: ValidationError, logger_instance: logging.Log
     Safely logs Pydantic ValidationErrors without leaking sensitive inputs
     (like passwords or internal absolute paths).
     """
-    error_list = e.errors(include_url=False, include_input=False)
-    
-    formatted_errors = []
-    for error in error_list:
-        loc = " -> ".join([str(p) for p in error.get("loc", ())])
-        msg = error.get("msg", "Unknown error")
-        formatted_errors.append(f"Field [{loc}]: {msg}")
-        
-    error_message = "\n".join(formatted_errors)
+    error_message = "\n".join(
+        f"Field [{' -> '.join(map(str, error['loc']))}]: {error['msg']}"
+        for error in e.errors(include_url=False, include_context=False, include_input=False)
+    )
     logger_instance.critical(f"Failed to validate configuration.\nDetails:\n{error_message}")
 
 
@@ -88,17 +130,17 @@ def bootstrap_dependencies(settings):
         event_bus=signal_bus,
     )
     
-    async_runner = AsyncioThreadRunner()
+    async_runner = AsyncioThreadRunner(realtime=settings.network.realtime)
     packet_parser = PacketParser()
     
     sanity_validator = TelemetrySanityValidator()
     
-    def ingestion_factory(udp_q: asyncio.Queue, out_q: IOutQueue, parser: IPacketParser) -> IngestionService:
+    def ingestion_factory(udp_q: DatagramQueue, out_q: IOutQueue, parser: IPacketParser) -> IngestionService:
         return IngestionService(queue=udp_q, out_queue=out_q, parser=parser, sanity_validator=sanity_validator)
 
     packet_validator = PacketValidator()
     
-    def udp_protocol_factory(q: asyncio.Queue) -> UdpListener:
+    def udp_protocol_factory(q: DatagramQueue) -> UdpListener:
         return UdpListener(q, packet_validator)
 
     core_facade = RealCoreFacade(
@@ -201,6 +243,8 @@ async def async_main():
     # 1. Load Configuration
     try:
         settings = get_settings()
+        # Replaces the bootstrap basicConfig handler; before the async runner starts its thread.
+        setup_logging(settings.env.value)
         logger.info(f"Configuration loaded successfully. Environment: {settings.env}")
         # Security Note: sensitive parameters like settings.network.api_url 
         # are intentionally omitted from startup logs to prevent leakage.
@@ -248,8 +292,11 @@ def main():
     loop = qasync.QEventLoop(app)
     asyncio.set_event_loop(loop)
 
-    # Handle Ctrl+C gracefully
-    signal.signal(signal.SIGINT, lambda *_: app.quit())
+    # Handle Ctrl+C / Ctrl+Break / SIGTERM gracefully
+    for sig in SHUTDOWN_SIGNALS:
+        signal.signal(sig, lambda *_: app.quit())
+    # Notifier + socketpair must stay alive for the whole loop; released in finally.
+    signal_wakeup = install_signal_wakeup(app)
 
     try:
         with loop:
@@ -257,6 +304,8 @@ def main():
     except Exception as e:
         logger.critical(f"Application failed to start: {e}", exc_info=True)
         sys.exit(1)
+    finally:
+        uninstall_signal_wakeup(*signal_wakeup)
 
 
 if __name__ == "__main__":
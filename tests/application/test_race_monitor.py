@@ -0,0 +1,32 @@
+from types import SimpleNamespace
+
+from desktop_client.application.services.race_monitor import RaceStateMonitor
+from desktop_client.domain.events import RaceStarted, RaceStopped
+
+
+def _packet(is_race_on: int, race_time: float = 0.0):
+    return SimpleNamespace(
+        is_race_on=is_race_on,
+        current_race_time=race_time,
+        car_ordinal=42,
+        car_class=5,
+        car_performance_index=800,
+    )
+
+
+def test_emits_start_and_stop_once_per_transition():
+    monitor = RaceStateMonitor()
+
+    assert monitor.detect_events(_packet(0)) == ()
+    started = monitor.detect_events(_packet(1, 1.5))
+    assert monitor.detect_events(_packet(1, 1.6)) == ()
+    stopped = monitor.detect_events(_packet(0, 9.0))
+
+    assert started == (RaceStarted(timestamp=1.5, car_ordinal=42, car_class=5, car_performance_index=800),)
+    assert stopped == (RaceStopped(timestamp=9.0),)
+
+
+def test_steady_state_returns_shared_empty_result():
+    monitor = RaceStateMonitor()
+
+    assert monitor.detect_events(_packet(0)) is monitor.detect_events(_packet(0))
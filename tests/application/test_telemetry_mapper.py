@@ -0,0 +1,23 @@
+import dataclasses
+
+from desktop_client.application.mappers.telemetry_mapper import serialize_batch
+from desktop_client.domain.models import TelemetryPacket
+
+
+_N_FIELDS = sum(1 for f in dataclasses.fields(TelemetryPacket) if f.default is dataclasses.MISSING)
+
+
+def _packet(i: int) -> TelemetryPacket:
+    return TelemetryPacket(*(float(i * 1000 + n) for n in range(_N_FIELDS)))
+
+
+def test_serialize_batch_matches_asdict():
+    batch = [_packet(i) for i in range(3)]
+
+    assert serialize_batch(batch) == [dataclasses.asdict(p) for p in batch]
+
+
+def test_serialize_batch_truncates_to_limit():
+    batch = [_packet(i) for i in range(5)]
+
+    assert len(serialize_batch(batch, max_input_size=2)) == 2
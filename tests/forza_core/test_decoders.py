@@ -0,0 +1,59 @@
+import dataclasses
+import struct
+from datetime import datetime, timezone
+
+import pytest
+
+from desktop_client.forza_core.decoders import fh4_decoder, fh5_decoder, fm7_decoder
+from desktop_client.forza_core.models import RawTelemetry
+
+_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _sample_values(fmt: str) -> tuple:
+    """Distinct, type-valid value per format code — any positional shift shows up."""
+    values = []
+    for i, code in enumerate(fmt.lstrip("<")):
+        if code in "fd":
+            values.append(float(i) + 0.5)
+        elif code == "b":
+            values.append(-(i % 100))
+        else:
+            values.append(i % 200)
+    return tuple(values)
+
+
+@pytest.mark.parametrize(
+    "decoder, fmt",
+    [
+        (fm7_decoder.Fm7Decoder(), fm7_decoder._FM7_FORMAT),
+        (fh4_decoder.Fh4Decoder(), fh4_decoder._FH4_FORMAT),
+        (fh5_decoder.Fh5Decoder(), fh5_decoder._FH5_FORMAT),
+    ],
+)
+def test_decode_maps_wire_fields_in_order(decoder, fmt):
+    values = _sample_values(fmt)
+    data = struct.pack(fmt, *values)
+
+    raw = decoder.decode(data, _NOW)
+
+    names = [f.name for f in dataclasses.fields(RawTelemetry)]
+    assert raw.received_at == _NOW
+    assert tuple(getattr(raw, name) for name in names[1:1 + len(values)]) == values
+
+
+def test_fm7_named_fields():
+    values = list(_sample_values(fm7_decoder._FM7_FORMAT))
+    values[0] = 1        # IsRaceOn
+    values[-4] = 3       # Gear
+    raw = fm7_decoder.Fm7Decoder().decode(struct.pack(fm7_decoder._FM7_FORMAT, *values), _NOW)
+
+    assert raw.IsRaceOn == 1
+    assert raw.Gear == 3
+    assert raw.NormalizedAIBrakeDifference == values[-1]
+    assert raw.HorizonPlaceholder is None
+
+
+def test_truncated_packet_raises_struct_error():
+    with pytest.raises(struct.error):
+        fm7_decoder.Fm7Decoder().decode(b"\x00" * 100, _NOW)
@@ -0,0 +1,41 @@
+import dataclasses
+import struct
+from datetime import datetime, timezone
+
+from desktop_client.forza_core.decoders import fh5_decoder
+from desktop_client.forza_core.packet_parser import PacketParser
+from desktop_client.forza_core.validators.consistency_check import ConsistencyCheck
+from desktop_client.forza_core.validators.range_check import RangeCheck
+
+_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+
+def _fh5_raw(**overrides):
+    """All-zero FH5 packet decoded for real, with selected wire fields overridden."""
+    zeros = [0.0 if code in "fd" else 0 for code in fh5_decoder._FH5_FORMAT.lstrip("<")]
+    raw = fh5_decoder.Fh5Decoder().decode(struct.pack(fh5_decoder._FH5_FORMAT, *zeros), _NOW)
+    return dataclasses.replace(raw, **overrides)
+
+
+def test_parse_maps_wire_fields_to_domain_names():
+    raw = _fh5_raw(IsRaceOn=1, TimestampMS=1234, Speed=42.5, TireTempRearRight=88.0,
+                   Gear=4, NormalizedAIBrakeDifference=-3)
+
+    packet = PacketParser().parse(raw)
+
+    assert packet.is_race_on == 1
+    assert packet.timestamp_ms == 1234
+    assert packet.speed_mps == 42.5
+    assert packet.tire_temp_rr == 88.0
+    assert packet.gear == 4
+    assert packet.normalized_ai_brake_difference == -3
+    assert packet.session_id is None
+
+
+def test_parsed_packet_passes_range_and_consistency_checks():
+    raw = _fh5_raw(EngineMaxRpm=8000.0, EngineIdleRpm=900.0, CurrentEngineRpm=4000.0,
+                   Speed=30.0, Fuel=0.5, CarPerformanceIndex=700, Gear=3, DrivetrainType=1)
+    packet = PacketParser().parse(raw)
+
+    assert RangeCheck().check(packet).is_valid
+    assert ConsistencyCheck().check(packet).is_valid
@@ -0,0 +1,122 @@
+from datetime import datetime, timezone
+
+from desktop_client.forza_core.models import RawPacket, ValidationResult
+from desktop_client.forza_core.pipeline_manager import PipelineManager
+
+
+class _EchoDecoder:
+    def decode(self, data, received_at):
+        return data
+
+
+class _Factory:
+    def get_decoder(self, size):
+        return _EchoDecoder() if size == 4 else None
+
+
+class _EchoParser:
+    def parse(self, raw):
+        return raw
+
+
+class _Validator:
+    def validate(self, packet):
+        if packet == b"bad!":
+            return ValidationResult.fail("bad")
+        return ValidationResult.ok()
+
+
+class _OutQueue:
+    def __init__(self):
+        self.items = []
+
+    def put_nowait(self, item):
+        self.items.append(item)
+        return True
+
+    def put_many(self, items):
+        self.items.extend(items)
+        return len(items)
+
+
+def _raw(data: bytes) -> RawPacket:
+    return RawPacket(data=data, source_ip="127.0.0.1", received_at=datetime.now(timezone.utc))
+
+
+def _make_pipeline(num_workers: int = 1):
+    out = _OutQueue()
+    pipeline = PipelineManager(_Factory(), _EchoParser(), _Validator(), out, num_workers=num_workers)
+    return pipeline, out
+
+
+def test_stop_drains_all_enqueued_packets_in_order():
+    pipeline, out = _make_pipeline()
+    # Enqueue before start: the worker wakes up to a full queue and drains it in bulk
+    for i in range(1000):
+        pipeline.enqueue(_raw(i.to_bytes(4, "little")))
+
+    pipeline.start()
+    pipeline.stop()
+
+    assert len(out.items) == 1000
+    assert out.items == [i.to_bytes(4, "little") for i in range(1000)]
+
+
+def test_full_in_queue_drops_oldest():
+    out = _OutQueue()
+    pipeline = PipelineManager(_Factory(), _EchoParser(), _Validator(), out, max_queue=3)
+    for i in range(5):
+        pipeline.enqueue(_raw(i.to_bytes(4, "little")))
+
+    pipeline.start()
+    pipeline.stop()
+
+    assert out.items == [i.to_bytes(4, "little") for i in (2, 3, 4)]
+    assert pipeline._drops_queue_full == 2
+
+
+def test_drops_are_counted_not_forwarded():
+    pipeline, out = _make_pipeline()
+    pipeline.start()
+    pipeline.enqueue(_raw(b"ok!!"))
+    pipeline.enqueue(_raw(b"bad!"))
+    pipeline.enqueue(_raw(b"wrong size"))
+    pipeline.stop()
+
+    assert out.items == [b"ok!!"]
+    assert pipeline._drops_validation_failed == 1
+    assert pipeline._drops_unknown_size == 1
+
+
+def test_multiple_workers_all_exit_after_drain():
+    pipeline, out = _make_pipeline(num_workers=3)
+    pipeline.start()
+    for _ in range(300):
+        pipeline.enqueue(_raw(b"ok!!"))
+    pipeline.stop()
+
+    assert len(out.items) == 300
+    assert not pipeline._in_queue
+
+
+def test_inline_mode_processes_in_caller_thread():
+    pipeline, out = _make_pipeline(num_workers=0)
+    pipeline.start()
+    pipeline.enqueue(_raw(b"ok!!"))
+
+    # No worker hop: the packet is already in OutQueue when enqueue() returns
+    assert out.items == [b"ok!!"]
+    assert not pipeline._in_queue
+    pipeline.stop()
+
+
+def test_dlq_logging_is_throttled(caplog):
+    pipeline, out = _make_pipeline(num_workers=0)
+    pipeline.start()
+    for _ in range(100):
+        pipeline.enqueue(_raw(b"bad!"))
+
+    dlq_lines = [r for r in caplog.records if "DLQ" in r.getMessage()]
+    assert len(dlq_lines) == 1
+    assert pipeline._drops_validation_failed == 100
+    pipeline.stop()
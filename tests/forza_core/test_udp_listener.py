@@ -0,0 +1,138 @@
+import asyncio
+import logging
+import socket
+import sys
+
+import pytest
+
+from desktop_client.forza_core import batch_receiver
+from desktop_client.forza_core.udp_listener import UdpListener
+
+
+class _AllowAll:
+    def is_allowed(self, ip: str) -> bool:
+        return True
+
+    def allow(self, ip: str) -> bool:
+        return True
+
+
+def _free_port() -> int:
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+@pytest.mark.skipif(not batch_receiver.is_supported(), reason="recvmmsg() is Linux-only")
+def test_recvmmsg_receiver_drains_batch():
+    """One receive() call returns every queued datagram with its source IP."""
+    receiver = batch_receiver.RecvmmsgReceiver(bufsize=512, batch_size=8)
+    with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as rx, \
+         socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as tx:
+        rx.bind(("127.0.0.1", 0))
+        for i in range(5):
+            tx.sendto(bytes([i]) * 324, rx.getsockname())
+
+        batch = receiver.receive(rx.fileno())
+
+        assert [data[0] for data, _ in batch] == [0, 1, 2, 3, 4]
+        assert all(len(data) == 324 for data, _ in batch)
+        assert all(ip == "127.0.0.1" for _, ip in batch)
+        # Nothing left → empty batch instead of blocking
+        assert receiver.receive(rx.fileno()) == []
+
+
+@pytest.mark.asyncio
+async def test_listener_forwards_raw_packets():
+    listener = UdpListener(_AllowAll(), _AllowAll())
+    received = []
+    all_received = asyncio.Event()
+
+    def on_packet(packet):
+        received.append(packet)
+        if len(received) == 3:
+            all_received.set()
+
+    listener.on_packet = on_packet
+    port = _free_port()
+
+    await listener.start("127.0.0.1", port)
+    try:
+        with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as tx:
+            for _ in range(3):
+                tx.sendto(b"\x01" * 311, ("127.0.0.1", port))
+        await asyncio.wait_for(all_received.wait(), timeout=1.0)
+    finally:
+        listener.stop()
+
+    assert len(received) == 3
+    assert received[0].source_ip == "127.0.0.1"
+    assert received[0].data == b"\x01" * 311
+
+
+@pytest.mark.skipif(not batch_receiver.is_supported(), reason="recvmmsg() is Linux-only")
+def test_stop_closes_socket_when_loop_is_stopped_but_not_closed():
+    """A stopped loop never runs call_soon_threadsafe() callbacks — stop() must close directly."""
+    listener = UdpListener(_AllowAll(), _AllowAll())
+    loop = asyncio.new_event_loop()
+    try:
+        loop.run_until_complete(listener.start("127.0.0.1", 0))
+        sock = listener._sock
+        fd = sock.fileno()
+
+        listener.stop()
+
+        assert sock.fileno() == -1
+        assert not loop.remove_reader(fd)  # reader already removed
+    finally:
+        loop.close()
+
+
+class _FakeRcvbufSocket:
+    def __init__(self, reported: int) -> None:
+        self._reported = reported
+
+    def getsockopt(self, level: int, option: int) -> int:
+        assert (level, option) == (socket.SOL_SOCKET, socket.SO_RCVBUF)
+        return self._reported
+
+
+def test_clamped_rcvbuf_is_reported(caplog):
+    listener = UdpListener(_AllowAll(), _AllowAll())
+    sock = listener._open_socket("127.0.0.1", 0)
+    try:
+        granted = sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+    finally:
+        sock.close()
+
+    if sys.platform.startswith("linux"):
+        granted //= 2
+    clamped = granted < 8 * 1024 * 1024
+    assert any("SO_RCVBUF clamped" in r.message for r in caplog.records) == clamped
+
+
+@pytest.mark.parametrize(
+    ("platform", "reported", "clamped"),
+    [
+        # Linux reports twice the granted size
+        ("linux", 2 * 8 * 1024 * 1024, False),
+        ("linux", 2 * 6 * 1024 * 1024, True),
+        ("linux", 8 * 1024 * 1024, True),
+        ("win32", 8 * 1024 * 1024, False),
+        ("win32", 6 * 1024 * 1024, True),
+    ],
+)
+def test_rcvbuf_check_accounts_for_linux_doubling(caplog, monkeypatch, platform, reported, clamped):
+    monkeypatch.setattr(sys, "platform", platform)
+    caplog.set_level(logging.DEBUG)
+
+    UdpListener._check_rcvbuf(_FakeRcvbufSocket(reported))
+
+    assert any("SO_RCVBUF clamped" in r.message for r in caplog.records) == clamped
+
+
+def test_reuse_port_unsupported_platform_is_rejected(monkeypatch):
+    monkeypatch.delattr(socket, "SO_REUSEPORT", raising=False)
+
+    with pytest.raises(ValueError, match="SO_REUSEPORT"):
+        UdpListener(_AllowAll(), _AllowAll(), reuse_port=True)
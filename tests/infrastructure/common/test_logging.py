@@ -0,0 +1,64 @@
+import logging
+
+import orjson
+import pytest
+import structlog
+
+from desktop_client.infrastructure.common import logging as app_logging
+
+
+@pytest.fixture
+def configure(capsys):
+    """Runs setup_logging, returns a reader that flushes the listener thread and returns stdout."""
+    def _configure(env: str):
+        app_logging.setup_logging(env)
+
+        def read() -> str:
+            app_logging._stop_listener()
+            return capsys.readouterr().out
+
+        return read
+
+    yield _configure
+    app_logging._stop_listener()
+    structlog.reset_defaults()
+    logging.getLogger().handlers.clear()
+
+
+def test_structlog_and_stdlib_records_share_the_output(configure):
+    read = configure("development")
+
+    structlog.get_logger("test").info("structlog_event", password="hunter2")
+    structlog.get_logger("test").debug("filtered_out")
+    logging.getLogger("plain").warning("stdlib %s", "event")
+
+    out = read()
+    assert "structlog_event" in out
+    assert "hunter2" not in out
+    assert "filtered_out" not in out
+    assert "stdlib event" in out
+
+
+def test_production_lines_are_json_with_rendered_traceback(configure):
+    read = configure("production")
+
+    structlog.get_logger("test").info("json_event", n=1)
+    try:
+        1 / 0
+    except ZeroDivisionError:
+        logging.getLogger("plain").exception("failed")
+
+    first, second = (orjson.loads(line) for line in read().splitlines())
+    assert first["event"] == "json_event" and first["n"] == 1
+    assert second["level"] == "error"
+    assert "ZeroDivisionError" in second["exception"]
+
+
+def test_console_output_has_no_ansi_codes_when_not_a_tty(configure):
+    read = configure("development")  # capsys stdout is not a TTY
+
+    structlog.get_logger("test").warning("plain_text_event", key="value")
+
+    out = read()
+    assert "plain_text_event" in out
+    assert "\x1b[" not in out
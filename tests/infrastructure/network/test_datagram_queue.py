@@ -0,0 +1,57 @@
+import asyncio
+
+import pytest
+
+from desktop_client.infrastructure.network.datagram_queue import DatagramQueue
+
+
+@pytest.mark.asyncio
+async def test_get_batch_returns_everything_in_order():
+    queue = DatagramQueue()
+    for i in range(5):
+        assert queue.put_nowait(i)
+
+    assert await queue.get_batch() == [0, 1, 2, 3, 4]
+    assert len(queue) == 0
+
+
+@pytest.mark.asyncio
+async def test_get_batch_waits_for_producer():
+    queue = DatagramQueue()
+    consumer = asyncio.create_task(queue.get_batch())
+    await asyncio.sleep(0)
+    assert not consumer.done()
+
+    queue.put_nowait(b"packet")
+    assert await asyncio.wait_for(consumer, timeout=1) == [b"packet"]
+
+
+def test_put_nowait_evicts_oldest_when_full():
+    queue = DatagramQueue(maxsize=2)
+    assert queue.put_nowait(1)
+    assert queue.put_nowait(2)
+    assert not queue.put_nowait(3)
+    assert len(queue) == 2
+    assert queue.dropped_total == 1
+
+
+@pytest.mark.asyncio
+async def test_newest_items_survive_overflow():
+    queue = DatagramQueue(maxsize=3)
+    for i in range(10):
+        queue.put_nowait(i)
+
+    assert await queue.get_batch() == [7, 8, 9]
+    assert queue.dropped_total == 7
+
+
+@pytest.mark.asyncio
+async def test_get_batch_respects_max_items():
+    queue = DatagramQueue()
+    for i in range(5):
+        queue.put_nowait(i)
+
+    assert await queue.get_batch(max_items=3) == [0, 1, 2]
+    # Remainder is still signalled — no wait on the second call
+    assert await asyncio.wait_for(queue.get_batch(max_items=3), timeout=1) == [3, 4]
+    assert len(queue) == 0
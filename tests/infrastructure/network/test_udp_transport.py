@@ -0,0 +1,32 @@
+from structlog.testing import capture_logs
+
+from desktop_client.infrastructure.network.datagram_queue import DatagramQueue
+from desktop_client.infrastructure.network.udp_transport import UdpListener
+from desktop_client.validation import PacketValidator
+
+_ADDR = ("127.0.0.1", 5300)
+
+
+def test_valid_datagram_is_queued():
+    queue = DatagramQueue()
+    listener = UdpListener(queue, PacketValidator())
+
+    listener.datagram_received(b"\x00" * 311, _ADDR)
+
+    assert len(queue) == 1
+    assert listener.dropped_packets == 0
+
+
+def test_invalid_datagrams_are_dropped_with_throttled_warning():
+    queue = DatagramQueue()
+    listener = UdpListener(queue, PacketValidator())
+
+    with capture_logs() as logs:
+        for _ in range(50):
+            listener.datagram_received(b"\x00" * 7, _ADDR)
+
+    assert len(queue) == 0
+    assert listener.dropped_packets == 50
+    drops = [entry for entry in logs if entry["event"] == "udp_packet_dropped"]
+    assert len(drops) == 1
+    assert drops[0]["size"] == 7
@@ -127,3 +127,12 @@ def test_take_all_remaining_pep8():
     result = buffer.take_all_remaining()
     assert result == [42]
     buffer._commit()
+
+
+def test_put_many_keeps_order_and_ring_semantics():
+    buffer = LocalBuffer(maxsize=4)
+    buffer.put_nowait(1)
+    assert buffer.put_many([2, 3, 4, 5]) == 4
+    # Oldest element (1) is pushed out, batch order preserved
+    with buffer.transaction_n(4) as batch:
+        assert batch == [2, 3, 4, 5]
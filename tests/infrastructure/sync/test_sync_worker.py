@@ -1,11 +1,41 @@
 import pytest
+import pytest_asyncio
 import asyncio
-from unittest.mock import AsyncMock, patch
+from unittest.mock import AsyncMock
 
 from desktop_client.infrastructure.sync.local_buffer import LocalBuffer
 from desktop_client.infrastructure.sync.sync_worker import SyncWorker
 
 
+class ManualClock:
+    """Виртуальные часы для _run_loop: ожидание тика не спит, а сдвигает время.
+
+    Подменяет loop.time() и asyncio.wait_for(); каждый таймаут ожидания
+    записывается в waits — по ним проверяется расписание тиков.
+    """
+
+    def __init__(self):
+        self.now = 0.0
+        self.waits: list[float] = []
+
+    def time(self) -> float:
+        return self.now
+
+    async def wait_for(self, aw, timeout):
+        aw.close()  # stop_event.wait() так и не дождались
+        self.waits.append(timeout)
+        self.now += timeout
+        raise asyncio.TimeoutError
+
+
+@pytest_asyncio.fixture
+async def manual_clock(monkeypatch):
+    clock = ManualClock()
+    monkeypatch.setattr(asyncio.get_running_loop(), "time", clock.time)
+    monkeypatch.setattr(asyncio, "wait_for", clock.wait_for)
+    return clock
+
+
 def _make_worker(buffer: LocalBuffer, **kwargs) -> SyncWorker:
     """Factory that always provides a valid serializer so tests stay focused."""
     return SyncWorker(
@@ -17,7 +47,7 @@ def _make_worker(buffer: LocalBuffer, **kwargs) -> SyncWorker:
 
 
 @pytest.mark.asyncio
-async def test_worker_successful_send():
+async def test_worker_successful_send(manual_clock):
     buffer = LocalBuffer()
     for i in range(1, 11):
         buffer.put_nowait(i)
@@ -32,16 +62,15 @@ async def test_worker_successful_send():
 
     worker._send_batch = AsyncMock(side_effect=mock_send_batch)
 
-    # Убираем реальный sleep для скорости тестов
-    with patch("asyncio.sleep", AsyncMock()):
-        await worker._run_loop()
+    await worker._run_loop()
 
     assert buffer.size == 0
     worker._send_batch.assert_called_once()
+    assert manual_clock.waits == [0.01]
 
 
 @pytest.mark.asyncio
-async def test_worker_failed_send_rolls_back():
+async def test_worker_failed_send_rolls_back(manual_clock):
     buffer = LocalBuffer()
     for i in range(1, 11):
         buffer.put_nowait(i)
@@ -56,14 +85,59 @@ async def test_worker_failed_send_rolls_back():
 
     worker._send_batch = AsyncMock(side_effect=mock_send_batch)
 
-    with patch("asyncio.sleep", AsyncMock()):
-        await worker._run_loop()
+    await worker._run_loop()
 
     # Размер должен остаться 10 из-за отката (rollback)
     assert buffer.size == 10
     worker._send_batch.assert_called_once()
 
 
+def _run_for_sends(worker: SyncWorker, clock: ManualClock, durations: list[float]):
+    """_send_batch, который «отправляет» len(durations) пачек, тратя на каждую заданное время."""
+    async def send(batch):
+        clock.now += durations[send.calls]
+        send.calls += 1
+        if send.calls == len(durations):
+            worker._is_running = False
+        return True
+
+    send.calls = 0
+    worker._send_batch = send
+
+
+@pytest.mark.asyncio
+async def test_worker_ticks_do_not_drift(manual_clock):
+    """Время отправки вычитается из следующего ожидания — период не растягивается."""
+    buffer = LocalBuffer()
+    for i in range(3):
+        buffer.put_nowait(i)
+
+    worker = _make_worker(buffer, batch_size=1, interval_sec=1.0)
+    worker._is_running = True
+    _run_for_sends(worker, manual_clock, [0.25, 0.25, 0.25])
+
+    await worker._run_loop()
+
+    assert manual_clock.waits == [1.0, 0.75, 0.75]
+
+
+@pytest.mark.asyncio
+async def test_worker_slow_send_skips_missed_ticks(manual_clock):
+    """Отправка дольше нескольких интервалов: пропущенные тики не отправляются пачкой подряд."""
+    buffer = LocalBuffer()
+    for i in range(4):
+        buffer.put_nowait(i)
+
+    worker = _make_worker(buffer, batch_size=1, interval_sec=1.0)
+    worker._is_running = True
+    _run_for_sends(worker, manual_clock, [3.5, 0.0, 0.0, 0.0])
+
+    await worker._run_loop()
+
+    # Один немедленный тик сразу после медленной отправки, дальше — обычный период.
+    assert manual_clock.waits == [1.0, 0.0, 1.0, 1.0]
+
+
 @pytest.mark.asyncio
 async def test_worker_stop_force_flushes():
     """stop() должен выполнить force-flush остатков буфера.
@@ -90,3 +164,16 @@ async def test_worker_stop_force_flushes():
     worker._send_batch.assert_called_once()
     # Буфер должен быть пуст после успешной отправки остатков
     assert buffer.size == 0
+
+
+@pytest.mark.asyncio
+async def test_worker_stop_interrupts_interval_wait():
+    """stop() не должен ждать окончания интервала между отправками."""
+    buffer = LocalBuffer()
+    worker = _make_worker(buffer, batch_size=10, interval_sec=30.0)
+
+    await worker.start()
+    await asyncio.sleep(0)  # цикл дошёл до ожидания следующего тика
+
+    await asyncio.wait_for(worker.stop(), timeout=1.0)
+    assert worker._task.done()
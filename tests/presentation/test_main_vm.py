@@ -1,56 +1,79 @@
 import pytest
-import asyncio
-from unittest.mock import MagicMock, patch, AsyncMock
+from unittest.mock import MagicMock, patch
 from desktop_client.presentation.viewmodels.main_vm import MainViewModel
-from desktop_client.presentation.state.config_state import ConfigState
-from desktop_client.presentation.state.session_state import SessionState
+from desktop_client.application.state import SessionFlowManager, MainFlowManager
+from desktop_client.domain.models import SessionState, MainState
 from desktop_client.domain.interface.interfaces import ITelemetryManager
 
 
+class AsyncRecorder:
+    """Awaitable call recorder: the subset of AsyncMock these tests use."""
+
+    def __init__(self):
+        self.call_count = 0
+        self.side_effect: BaseException | None = None
+
+    async def __call__(self):
+        self.call_count += 1
+        if self.side_effect is not None:
+            raise self.side_effect
+
+    def assert_called_once(self):
+        assert self.call_count == 1, f"expected 1 call, got {self.call_count}"
+
+
+class StubTelemetryManager(ITelemetryManager):
+    """Plain ITelemetryManager stub — no MagicMock spec introspection per test."""
+
+    def __init__(self):
+        self.start_session = AsyncRecorder()
+        self.stop_session = AsyncRecorder()
+
+
 @pytest.fixture
 def mock_telemetry_manager():
-    tm = MagicMock(spec=ITelemetryManager)
-    tm.start_session = AsyncMock()
-    tm.stop_session = AsyncMock()
-    return tm
+    return StubTelemetryManager()
 
 
 @pytest.fixture
 def viewModel(mock_telemetry_manager):
-    vm = MainViewModel(mock_telemetry_manager)
+    vm = MainViewModel(mock_telemetry_manager, SessionFlowManager(), MainFlowManager())
     yield vm
 
 
+def _ready_to_start(vm: MainViewModel) -> None:
+    vm.main_flow.set_state(MainState.VALID_CONFIG)
+    vm.main_flow.set_state(MainState.READY_TO_START)
+
+
 def test_initial_state_is_idle(viewModel):
-    assert viewModel.app_state.session_state == SessionState.IDLE
-    assert viewModel.app_state.config_state == ConfigState.EMPTY
+    assert viewModel.session_flow.state == SessionState.IDLE
+    assert viewModel.main_flow.state == MainState.MONITORING_CONFIG
 
 
 @pytest.mark.asyncio
 async def test_start_recording_sets_recording_state(viewModel):
-    """Config gate is bypassed by manually setting READY state."""
-    viewModel.app_state.config_state = ConfigState.READY
+    _ready_to_start(viewModel)
 
     await viewModel.start_recording()
 
-    assert viewModel.app_state.session_state == SessionState.RECORDING
+    assert viewModel.session_flow.state == SessionState.RECORDING
     viewModel._telemetry_manager.start_session.assert_called_once()
 
 
 @pytest.mark.asyncio
 async def test_stop_session_calls_tm(viewModel):
-    viewModel.app_state.config_state = ConfigState.READY
+    _ready_to_start(viewModel)
     await viewModel.start_recording()  # → RECORDING
 
-    await viewModel.stop_recording()  # → IDLE
+    await viewModel.stop_recording()  # → FLUSHING → IDLE
 
-    assert viewModel.app_state.session_state == SessionState.IDLE
+    assert viewModel.session_flow.state == SessionState.IDLE
     viewModel._telemetry_manager.stop_session.assert_called_once()
 
 
 def test_toggle_session_starts_recording(viewModel):
-    viewModel.app_state.session_state = SessionState.IDLE
-    viewModel.app_state.config_state = ConfigState.READY
+    _ready_to_start(viewModel)
 
     with patch("asyncio.get_event_loop") as mock_loop:
         mock_loop.return_value.create_task = MagicMock()
@@ -59,8 +82,16 @@ def test_toggle_session_starts_recording(viewModel):
             mock_loop.return_value.create_task.assert_called_once_with("dummy_coro")
 
 
+def test_toggle_session_does_not_start_without_valid_config(viewModel):
+    with patch("asyncio.get_event_loop") as mock_loop:
+        mock_loop.return_value.create_task = MagicMock()
+        viewModel.toggle_session()
+        mock_loop.return_value.create_task.assert_not_called()
+
+
 def test_toggle_session_stops_recording(viewModel):
-    viewModel.app_state.session_state = SessionState.RECORDING
+    viewModel.session_flow.set_state(SessionState.STARTING)
+    viewModel.session_flow.set_state(SessionState.RECORDING)
 
     with patch("asyncio.get_event_loop") as mock_loop:
         mock_loop.return_value.create_task = MagicMock()
@@ -70,7 +101,7 @@ def test_toggle_session_stops_recording(viewModel):
 
 
 @pytest.mark.asyncio
-async def test_start_recording_network_error_resets_state_and_emits_error(viewModel, mock_telemetry_manager):
+async def test_start_recording_network_error_sets_error_state_and_emits_error(viewModel, mock_telemetry_manager):
     mock_telemetry_manager.start_session.side_effect = ConnectionError("UDP bind failed")
 
     mock_emit = MagicMock()
@@ -78,17 +109,20 @@ async def test_start_recording_network_error_resets_state_and_emits_error(viewMo
 
     await viewModel.start_recording()
 
-    assert viewModel.app_state.session_state == SessionState.IDLE
+    assert viewModel.session_flow.state == SessionState.ERROR
     mock_emit.assert_called_once()
-    assert "UDP bind failed" in mock_emit.call_args[0][0]
+    message = mock_emit.call_args[0][0]
+    assert "Network or system connection problem" in message
+    # Raw exception text stays in the log, not in the UI
+    assert "UDP bind failed" not in message
 
 
 @pytest.mark.asyncio
-async def test_start_recording_unexpected_error_emits_error_and_resets_state(viewModel, mock_telemetry_manager):
+async def test_start_recording_unexpected_error_emits_error_and_sets_error_state(viewModel, mock_telemetry_manager):
     """
     Unexpected errors in fire-and-forget tasks must NOT re-raise (that would silently
     rot in the asyncio event loop). Instead they must surface via error_occurred
-    so the UI can show a dialog, and state must be reset to IDLE.
+    so the UI can show a dialog, and the session must move to ERROR.
     """
     mock_telemetry_manager.start_session.side_effect = TypeError("NoneType is not iterable")
 
@@ -97,6 +131,6 @@ async def test_start_recording_unexpected_error_emits_error_and_resets_state(vie
 
     await viewModel.start_recording()   # must NOT raise
 
-    assert viewModel.app_state.session_state == SessionState.IDLE
+    assert viewModel.session_flow.state == SessionState.ERROR
     mock_emit.assert_called_once()
-    assert "NoneType is not iterable" in mock_emit.call_args[0][0]
+    assert "Internal application error" in mock_emit.call_args[0][0]
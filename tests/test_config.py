@@ -0,0 +1,49 @@
+import pytest
+
+from config import BASE_DIR, Settings
+
+
+@pytest.fixture
+def base_env(monkeypatch):
+    """Minimal valid environment; paths point at a file that exists inside BASE_DIR."""
+    existing_file = str(BASE_DIR / "src" / "config.py")
+    monkeypatch.setenv("DB_HOST", "localhost")
+    monkeypatch.setenv("DB_PORT", "5432")
+    monkeypatch.setenv("DB_USER", "postgres")
+    monkeypatch.setenv("DB_PASSWORD", "secret")
+    monkeypatch.setenv("DB_NAME", "mydb")
+    monkeypatch.setenv("AI_MODEL_PATH", existing_file)
+    for name in ("MAIN_WINDOW_PATH", "CONFIG_DIALOG_PATH", "SETTINGS_DIALOG_PATH"):
+        monkeypatch.setenv(f"UI_{name}", existing_file)
+    return monkeypatch
+
+
+def test_pool_size_env_override(base_env):
+    """Multi-word fields must not be split further: DB_POOL_SIZE → db.pool_size."""
+    base_env.setenv("DB_POOL_SIZE", "9")
+    base_env.setenv("DB_POOL_MAX_OVERFLOW", "5")
+
+    settings = Settings()
+
+    assert settings.db.pool_size == 9
+    assert settings.db.pool_max_overflow == 5
+
+
+def test_pool_timeouts_env_override(base_env):
+    base_env.setenv("DB_POOL_RECYCLE_SEC", "600")
+    base_env.setenv("DB_COMMAND_TIMEOUT_SEC", "5")
+
+    settings = Settings()
+
+    assert settings.db.pool_recycle_sec == 600
+    assert settings.db.command_timeout_sec == 5.0
+
+
+def test_dsn_follows_model_copy(base_env):
+    db = Settings().db
+    assert "@localhost:" in db.connection_string.get_secret_value()
+
+    moved = db.model_copy(update={"host": "db.internal"})
+
+    assert "@db.internal:" in moved.connection_string.get_secret_value()
+    assert "@db.internal:" in moved.asyncpg_dsn.get_secret_value()